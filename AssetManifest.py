@@ -0,0 +1,219 @@
+"""
+Builds and checks assets/manifest.json, the record of every file under assets/: its size,
+image or video dimensions, SHA-1 and the game functions that load it.
+
+Usage: python AssetManifest.py [GAME_DIR]
+The consumers are found by reading HydropowerMarketGame.py for asset paths, path templates
+('..._{}.jpg', f-strings) and the module constants that hold them. Files no function refers
+to are listed with no consumers.
+
+AssetVerifier compares the files on disk with the manifest at start-up. Hashes are kept in a
+local state file together with each file's modification time and size, so a run only reads
+the files that were touched since the last one. Derived caches key off these hashes.
+A bundled build (PyInstaller) cannot change after it is built and unpacks its files with new
+modification times on every launch, so there the manifest hashes are trusted as they are.
+"""
+import ast
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = "assets/manifest.json"
+GAME_SOURCE = "HydropowerMarketGame.py"
+IGNORED_NAMES = {'manifest.json', 'Thumbs.db', '.DS_Store'}
+VIDEO_EXTENSIONS = {'.mp4', '.ts'}
+# JPEG start-of-frame markers; C4, C8 and CC share the range but are not frame headers
+JPEG_FRAME_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+def file_sha1(path):
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+def list_assets(root):
+    """Relative paths, with forward slashes, of every asset file under root/assets."""
+    paths = []
+    for directory, directories, files in os.walk(os.path.join(root, "assets")):
+        directories[:] = sorted(name for name in directories if name != '__pycache__')
+        for name in sorted(files):
+            if name not in IGNORED_NAMES:
+                paths.append(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/'))
+    return paths
+
+def image_dimensions(data):
+    """(width, height) read from a PNG or JPEG header, or None for other files."""
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return list(struct.unpack('>II', data[16:24]))
+    if data[:2] == b'\xff\xd8':
+        i = 2
+        while i + 9 <= len(data) and data[i] == 0xFF:
+            marker = data[i + 1]
+            if marker == 0xFF:
+                i += 1
+                continue
+            if marker in JPEG_FRAME_MARKERS:
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return [width, height]
+            i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+    return None
+
+def video_dimensions(path):
+    import cv2  # Only needed when building the manifest
+    capture = cv2.VideoCapture(path)
+    try:
+        if not capture.isOpened():
+            return None
+        return [int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))]
+    finally:
+        capture.release()
+
+def path_value(node, constants):
+    """The asset path an expression spells out, with '{}' for any formatted part, or None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return ''.join(value.value if isinstance(value, ast.Constant) else '{}' for value in node.values)
+    if isinstance(node, ast.Name) and isinstance(constants.get(node.id), str):
+        return constants[node.id]
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'join' \
+            and ast.unparse(node.func.value) == 'os.path':
+        parts = [path_value(arg, constants) for arg in node.args]
+        if parts and all(isinstance(part, str) for part in parts):
+            return '/'.join(parts)
+    return None
+
+def path_pattern(path):
+    """Regex for a path template; each '{...}' field matches one file name part."""
+    return re.compile('[^/]*'.join(re.escape(part) for part in re.split(r'\{[^{}]*\}', path)))
+
+def find_consumers(source_path):
+    """[(pattern, consumer)] for every asset path in the game source, named by the function
+    (Class.method for methods) that uses the path or the module constant holding it."""
+    with open(source_path, encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+    constants, constant_paths = {}, {}
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+            name = statement.targets[0].id
+            value = path_value(statement.value, constants)
+            if value is not None:
+                constants[name] = value
+            paths = [path for path in (path_value(node, constants) for node in ast.walk(statement.value)) if path and path.startswith('assets/')]
+            if paths and not any(isinstance(node, ast.Call) and path_value(node, constants) is None for node in ast.walk(statement.value)):
+                constant_paths[name] = paths
+
+    uses = []
+    def visit(node, scope):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            scope = scope + [node.name]
+        elif not scope and isinstance(node, ast.Assign) and any(isinstance(target, ast.Name) and target.id in constant_paths for target in node.targets):
+            return  # A path constant is only a use where a function reads it
+        path = path_value(node, constants)
+        if path and path.startswith('assets/'):
+            uses.append((path, '.'.join(scope) or '<module>'))
+        if isinstance(node, ast.Name) and node.id in constant_paths and scope:
+            uses.extend((path, '.'.join(scope)) for path in constant_paths[node.id])
+        for child in ast.iter_child_nodes(node):
+            visit(child, scope)
+    visit(tree, [])
+    return [(path_pattern(path), consumer) for path, consumer in sorted(set(uses))]
+
+def build_manifest(root):
+    """Manifest for every file under root/assets, hashing and measuring each one."""
+    consumers = find_consumers(os.path.join(root, GAME_SOURCE))
+    files = {}
+    for relative_path in list_assets(root):
+        path = os.path.join(root, relative_path)
+        with open(path, 'rb') as file:
+            data = file.read()
+        if os.path.splitext(relative_path)[1].lower() in VIDEO_EXTENSIONS:
+            dimensions = video_dimensions(path)
+        else:
+            dimensions = image_dimensions(data)
+        files[relative_path] = {
+            'bytes': len(data),
+            'dimensions': dimensions,
+            'sha1': hashlib.sha1(data).hexdigest(),
+            'consumers': sorted({consumer for pattern, consumer in consumers if pattern.fullmatch(relative_path)}),
+        }
+    return {'version': MANIFEST_VERSION, 'files': files}
+
+def write_manifest(manifest, path):
+    with open(path + ".tmp", 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+        file.write("\n")
+    os.replace(path + ".tmp", path)
+
+def load_manifest(path):
+    """The manifest at path, or None if it is missing, unreadable or from another version."""
+    try:
+        with open(path, 'r') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+class AssetVerifier:
+    """Current hashes of the asset files, checked against a manifest with mtime and size shortcuts.
+    With bundled set, files listed in the manifest are taken to match it and are never read."""
+    def __init__(self, root, manifest_path, state_path, bundled=False):
+        self.root = root
+        self.manifest = load_manifest(manifest_path)
+        self.bundled = bundled
+        self.state_path = state_path
+        try:
+            with open(state_path, 'r') as file:
+                self.state = json.load(file)
+        except (OSError, ValueError):
+            self.state = {}
+        self.state_changed = False
+        self.hashed = 0
+
+    def file_hash(self, relative_path):
+        """SHA-1 of an asset, only read again when its size or modification time changed. Raises OSError if missing."""
+        if self.bundled and self.manifest is not None:
+            listed = self.manifest['files'].get(relative_path.replace(os.sep, '/'))
+            if listed is not None:
+                return listed['sha1']
+        path = os.path.join(self.root, relative_path)
+        stat = os.stat(path)
+        entry = self.state.get(relative_path)
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            entry = [stat.st_mtime_ns, stat.st_size, file_sha1(path)]
+            self.state[relative_path] = entry
+            self.state_changed = True
+            self.hashed += 1
+        return entry[2]
+
+    def verify(self):
+        """Check every file in the manifest; returns (changed, missing) relative paths."""
+        changed, missing = [], []
+        if self.manifest is None or self.bundled:
+            return changed, missing
+        for relative_path, listed in self.manifest['files'].items():
+            try:
+                if self.file_hash(relative_path) != listed['sha1']:
+                    changed.append(relative_path)
+            except OSError:
+                missing.append(relative_path)
+        return changed, missing
+
+    def save(self):
+        """Write the hash state if it changed. Raises OSError if it cannot be written."""
+        if self.state_changed:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            with open(self.state_path, 'w') as file:
+                json.dump(self.state, file)
+            self.state_changed = False
+
+if __name__ == '__main__':
+    game_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(os.path.abspath(__file__))
+    manifest = build_manifest(game_dir)
+    write_manifest(manifest, os.path.join(game_dir, MANIFEST_PATH))
+    unused = sum(1 for entry in manifest['files'].values() if not entry['consumers'])
+    print(f"Wrote {MANIFEST_PATH}: {len(manifest['files'])} files, {unused} not referenced by the game.")
@@ -0,0 +1,73 @@
+"""
+Process-wide store for loaded game assets, shared between scenes and kept across replays.
+
+Each asset is stored under a key of (path, target size, format) and records which scenes
+are using it. When a scene ends it releases its assets; they stay loaded so the next play
+finds them, until the store grows past its memory budget and the least recently used
+unreferenced assets are dropped.
+"""
+from collections import OrderedDict
+
+class AssetEntry:
+    def __init__(self, value):
+        self.value = value
+        self.scenes = set()
+
+class AssetRegistry:
+    """Shared assets with per-scene references, an LRU order and a memory budget in bytes."""
+    def __init__(self, budget, sizer):
+        self.budget = budget
+        self.sizer = sizer
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, scene, key, loader):
+        """Return the asset for a key, calling loader() on a miss; the scene holds it until released."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = AssetEntry(loader())
+            self.entries[key] = entry
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        if scene is not None:
+            entry.scenes.add(scene)
+        self.evict()
+        return entry.value
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def release_scene(self, scene):
+        for entry in self.entries.values():
+            entry.scenes.discard(scene)
+        self.evict()
+
+    def total_bytes(self):
+        return sum(self.sizer(entry.value) for entry in self.entries.values())
+
+    def evict(self):
+        """Drop unreferenced assets, least recently used first, until the store fits its budget."""
+        total = self.total_bytes()
+        for key in [key for key, entry in self.entries.items() if not entry.scenes]:
+            if total <= self.budget:
+                break
+            total -= self.sizer(self.entries.pop(key).value)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'referenced': sum(1 for entry in self.entries.values() if entry.scenes),
+            'bytes': self.total_bytes(),
+            'budget': self.budget,
+        }
@@ -0,0 +1,105 @@
+"""
+Partial display updates for the level screens, which repaint the same static scene every frame.
+
+The level loops redraw their backdrop in full each frame, but only the animated parts differ
+from what is already on the display. Those draws are reported to a DirtyRects tracker and
+present() hands just their areas to pygame.display.update(). The areas drawn on the previous
+frame are presented again, so a light that moved on or a label that got shorter is cleared
+from the display too.
+
+A draw that often repeats the previous frame (a water level, a panel, a label) can pass a key
+naming its content, such as the frame index or the text; it is then only presented when that
+content or its place changes, or when it stops being drawn. When the areas cover most of the
+screen a single flip is cheaper, and frames that change everything (the first one, an overlay)
+call invalidate() to get a flip.
+"""
+import pygame
+
+# Share of the screen above which one full flip replaces the rect updates
+FLIP_COVERAGE = 0.6
+
+def merge_rects(rects):
+    """Union overlapping rects wherever the union is no bigger than the two areas pushed separately."""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        merging = True
+        while merging:
+            merging = False
+            for index in rect.collidelistall(merged):
+                other = merged[index]
+                union = rect.union(other)
+                if union.width * union.height <= rect.width * rect.height + other.width * other.height:
+                    merged.pop(index)
+                    rect = union
+                    merging = True
+                    break
+        merged.append(rect)
+    return merged
+
+class DirtyRects:
+    """Screen areas redrawn with changing content this frame, presented together by present()."""
+    def __init__(self, target, flip_coverage=FLIP_COVERAGE):
+        self.target = target
+        self.flip_coverage = flip_coverage
+        self.rects = []
+        self.previous = []
+        # Keyed draws of this frame and the last one, as {key: rect}
+        self.keyed = {}
+        self.previous_keyed = {}
+        # The first frame has nothing on the display to build on
+        self.full = True
+        self.flips = 0
+        self.updates = 0
+        self.presented_pixels = 0
+
+    def add(self, rect, key=None):
+        """Report an area of the target that was drawn on; empty or None rects are ignored.
+        With a key, the area is only reported if the same key was not drawn there last frame."""
+        if not rect:
+            return rect
+        rect = pygame.Rect(rect).clip(self.target.get_rect())
+        if key is not None:
+            self.keyed[key] = rect
+            if self.previous_keyed.get(key) == rect:
+                return rect
+        if rect.width and rect.height:
+            self.rects.append(rect)
+        return rect
+
+    def blit(self, surface, position, area=None, special_flags=0, key=None):
+        """Blit onto the target and report the area it covered."""
+        return self.add(self.target.blit(surface, position, area, special_flags), key)
+
+    def invalidate(self):
+        """Have the next present() flip the whole screen."""
+        self.full = True
+
+    def present(self):
+        # Keyed content that changed or went away leaves its old area to clear
+        stale = [rect for key, rect in self.previous_keyed.items() if self.keyed.get(key) != rect]
+        rects = merge_rects(self.rects + self.previous + stale)
+        self.previous, self.rects = self.rects, []
+        self.previous_keyed, self.keyed = self.keyed, {}
+        covered = sum(rect.width * rect.height for rect in rects)
+        screen_pixels = self.target.get_width() * self.target.get_height()
+        if self.full or covered >= self.flip_coverage * screen_pixels:
+            pygame.display.flip()
+            self.full = False
+            self.flips += 1
+            self.presented_pixels += screen_pixels
+        elif rects:
+            pygame.display.update(rects)
+            self.updates += 1
+            self.presented_pixels += covered
+        else:
+            self.updates += 1
+
+    def stats(self):
+        frames = self.flips + self.updates
+        screen_pixels = self.target.get_width() * self.target.get_height()
+        return {
+            'flips': self.flips,
+            'updates': self.updates,
+            'presented_share': self.presented_pixels / (frames * screen_pixels) if frames else 0.0,
+        }
@@ -0,0 +1,86 @@
+"""
+Packed frame-sequence files: every frame of an animation, already decoded and scaled,
+stored back to back as raw pixels behind a small JSON index.
+
+Layout: MAGIC | header length (uint32, little endian) | JSON header | padding | pixel data
+The header lists the pixel format and the offset and size of each frame, so a frame is
+just a slice of the memory-mapped file.
+"""
+import json
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b'HPFRAMES'
+PACK_VERSION = 1
+DATA_ALIGNMENT = 64
+BYTES_PER_PIXEL = {'RGB': 3, 'RGBA': 4}
+
+class FramePack:
+    """Read-only view of a pack file; frames are slices of a shared np.memmap."""
+    def __init__(self, path, header, data):
+        self.path = path
+        self.header = header
+        self.data = data
+        self.format = header['format']
+        self.frames = header['frames']
+        self.meta = header.get('meta', {})
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame_size(self, index):
+        _, width, height = self.frames[index]
+        return width, height
+
+    def frame_bytes(self, index):
+        offset, width, height = self.frames[index]
+        return self.data[offset:offset + width * height * BYTES_PER_PIXEL[self.format]]
+
+def write_pack(path, frames, pixel_format, meta=None):
+    """Write (raw_bytes, width, height) frames to a pack; the file only appears once it is complete."""
+    entries = []
+    offset = 0
+    for raw_data, width, height in frames:
+        if len(raw_data) != width * height * BYTES_PER_PIXEL[pixel_format]:
+            raise ValueError(f"Frame of {width}x{height} has {len(raw_data)} bytes of {pixel_format} data")
+        entries.append([offset, width, height])
+        offset += len(raw_data)
+    header = json.dumps({'version': PACK_VERSION, 'format': pixel_format, 'frames': entries, 'meta': meta or {}}).encode('utf-8')
+    prefix = len(MAGIC) + 4 + len(header)
+    padding = -prefix % DATA_ALIGNMENT
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(MAGIC)
+        file.write(struct.pack('<I', len(header)))
+        file.write(header)
+        file.write(b'\0' * padding)
+        for raw_data, _, _ in frames:
+            file.write(raw_data)
+    os.replace(temp_path, path)
+
+def open_pack(path):
+    """Memory-map a pack file. Returns None if it is missing, truncated or from another version."""
+    try:
+        with open(path, 'rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                return None
+            header_length, = struct.unpack('<I', file.read(4))
+            header = json.loads(file.read(header_length).decode('utf-8'))
+    except (OSError, ValueError, struct.error):
+        return None
+    if header.get('version') != PACK_VERSION:
+        return None
+
+    prefix = len(MAGIC) + 4 + header_length
+    data_start = prefix + (-prefix % DATA_ALIGNMENT)
+    data_length = sum(width * height * BYTES_PER_PIXEL[header['format']] for _, width, height in header['frames'])
+    if os.path.getsize(path) != data_start + data_length:
+        return None
+    if data_length == 0:
+        return FramePack(path, header, np.zeros(0, dtype=np.uint8))
+    data = np.memmap(path, dtype=np.uint8, mode='r', offset=data_start, shape=(data_length,))
+    return FramePack(path, header, data)
@@ -65,25 +65,34 @@ Python Libraries:
 
 Thank you for playing the Hydropower Market Game!
 """
+import time
+BOOT_START = time.perf_counter()
 import pygame
+import pygame.gfxdraw
 import sys
 import os
 from pathlib import Path
 import webbrowser
-import cv2
 import numpy as np
 import random
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
-import tempfile
-plt.rcParams["axes3d.mouserotationstyle"] = 'azel'
-from matplotlib.backends.backend_agg import FigureCanvasAgg
+# matplotlib, scipy and cv2 are imported the first time a screen uses them
+from LazyImports import cv2, matplotlib, plt, mticker, Figure, font_manager, FigureCanvasAgg, linprog, LazyModule
 # from ortools.math_opt.python import mathopt
-from scipy.optimize import linprog
-import time
 import json
+import re
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import subprocess
+import tempfile
+from collections import OrderedDict
+import FramePack
+import AssetRegistry
+import AssetManifest
+import VideoBackground
+import DirtyRects
+# SurfaceAtlas builds its figures with matplotlib, so it waits for the model screen too
+SurfaceAtlas = LazyModule('SurfaceAtlas', requires=(matplotlib,))
 
 #Colors
 BLACK = (0, 0, 0)
@@ -118,17 +127,47 @@ def get_save_path():
     return save_dir / "save_game.json"
 
 SAVE_FILE = get_save_path()
+CACHE_DIR = SAVE_FILE.parent / "cache"
+FRAME_PACK_DIR = CACHE_DIR / "frame_packs"
+# Hashes of the asset files as last verified against assets/manifest.json
+ASSET_STATE_FILE = CACHE_DIR / "asset_state.json"
+asset_verifier = None
+asset_verifier_lock = threading.Lock()
+level_prefetcher = None
 
 #Model Variables
 fig_3d, ax_3d, canvas_3d, scatter = None, None, None, None
 fig_colormap, ax_colormap, canvas_colormap, red_dot = None, None, None, None
+colormap_background, colormap_transform, colormap_axes_rect, colormap_dot_radius = None, None, None, None
+# Pre-rendered 3D views used while the model plot is dragged
+SURFACE_ATLAS_DIR = CACHE_DIR / "surface_atlas"
+SURFACE_ATLAS_CACHED_VIEWS = 48
+surface_atlas = None
+surface_atlas_views = OrderedDict()
+# Draw the model's 3D plot with the NumPy/pygame renderer instead of matplotlib
+NATIVE_3D_SURFACE = False
 g = 9.81  # Gravity
+# (Q, h) power maps drawn with NumPy and pygame; False uses the matplotlib figures
+NATIVE_COLORMAPS = True
+VIRIDIS_LUT = None
+COLORMAP_PANELS = {
+    'model': {'Q_max': 10000, 'grid': (200, 200), 'power': lambda Q, h: 0.00007 * Q * h, 'text_color': BLACK,
+              'figsizes': {960: (4, 3), 1280: (5, 4), 1600: (6, 5)},
+              'ticks': (range(0, 10001, 2000), range(0, 101, 20), range(0, 71, 10))},
+    'dam': {'Q_max': 4, 'grid': (50, 200), 'power': lambda Q, h: (Q * g * h)/40, 'text_color': WHITE,
+            'figsizes': {960: (2.5, 2), 1280: (3.5, 2.5), 1600: (4.5, 3)},
+            'ticks': ((), (), ())},
+}
+# Cached heatmap and axes layers, keyed by (panel, width, height)
+colormap_layers = {}
 
 # Screen settings
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Hydropower Market Game")
+# Color used as the transparent key of RLE sprites; never appears in their opaque pixels
+SPRITE_COLORKEY = (255, 0, 255)
 
 #Character Select variables
 FACE_PATH_TEMPLATE = "assets/CYC_Assets/Faces/F{}.jpg"
@@ -328,6 +367,21 @@ UPPER_RESERVOIR_PATH_TEMPLATE = 'assets/PSHSequences/PSHUpperReservoirFramesCut/
 FLOW_CUT_NUM_FRAMES = 211
 FLOW_CUT_PATH_TEMPLATE = 'assets/PSHSequences/PSHNoFlowTest1/NoFlow_frame_{}.jpg'
 
+#Frame sequences each level loads, as (loader, frame count, path template)
+LEVEL_FRAME_SEQUENCES = {
+    'RoR_Level': [('ror', NUM_ROR_FRAMES, WATER_LOWER_PATH_TEMPLATE), ('ror', NUM_ROR_FRAMES, TUBE_PATH_TEMPLATE)],
+    'Dam_Level': [('dam', NUM_SPILLWAY_FRAMES, SPILLWAY_PATH_TEMPLATE), ('dam', NUM_WATER_FRAMES, WATER_PATH_TEMPLATE),
+                  ('dam', NUM_FLOW_FRAMES, FLOW_PATH_TEMPLATE), ('dam', NUM_FLOW_FRAMES, FLOW2_PATH_TEMPLATE),
+                  ('dam', NUM_FLOW_FRAMES, FLOW3_PATH_TEMPLATE), ('dam', NUM_FLOW_FRAMES, FLOW4_PATH_TEMPLATE),
+                  ('dam', NUM_TURBINE_FRAMES, TURBINE_PATH_TEMPLATE), ('dam', NUM_TURBINE_FRAMES, TURBINE2_PATH_TEMPLATE),
+                  ('dam', NUM_TURBINE_FRAMES, TURBINE3_PATH_TEMPLATE), ('dam', NUM_TURBINE_FRAMES, TURBINE4_PATH_TEMPLATE),
+                  ('bar', BAR_IMAGE_COUNT, BAR_IMAGE_PATH_TEMPLATE)],
+    'PSH_Level': [('psh', NUM_PSH_FRAMES, PSH_PATH_TEMPLATE), ('psh', POWERHOUSE_NUM_FRAMES, POWERHOUSE_PATH_TEMPLATE),
+                  ('upper_reservoir', NUM_PSH_FRAMES, UPPER_RESERVOIR_PATH_TEMPLATE), ('psh', FLOW_CUT_NUM_FRAMES, FLOW_CUT_PATH_TEMPLATE),
+                  ('bar', BAR_IMAGE_COUNT, BAR_IMAGE_PATH_TEMPLATE)],
+}
+SUPPORTED_RESOLUTIONS = [(960, 540), (1280, 720), (1600, 900)]
+
 PSH_LOAD = np.array([ 4.00000000e+02,  3.98629950e+02,  3.97103074e+02,  3.95425686e+02,
         3.93604099e+02,  3.91644628e+02,  3.89553587e+02,  3.87337289e+02,
         3.85002050e+02,  3.82554182e+02,  3.80000000e+02,  3.77345818e+02,
@@ -389,6 +443,26 @@ PSH_LOAD = np.array([ 4.00000000e+02,  3.98629950e+02,  3.97103074e+02,  3.95425
         3.74933369e+02,  3.73895884e+02,  3.73933395e+02,  3.75104236e+02,
         3.77466738e+02,  3.81079233e+02,  3.86000053e+02,  3.92287532e+02])
 
+#Power Graph Variables
+# One persistent figure per graph style, keyed by (style, legend location)
+power_graphs = {}
+POWER_GRAPH_STYLES = {
+    'example': {'load_curve': LOAD_CURVE, 'load_scale': 30, 'load_offset': 0, 'ylim': (1, 20), 'fontsize': 16, 'dpi': 400, 'zero_line': False},
+    'ror': {'load_curve': LOAD_CURVE, 'load_scale': 110, 'load_offset': 0, 'ylim': (0, 6), 'fontsize': None, 'dpi': 400, 'zero_line': False},
+    'dam': {'load_curve': LOAD_CURVE, 'load_scale': 6, 'load_offset': -15, 'ylim': (-5, 100), 'fontsize': 14, 'dpi': 300, 'zero_line': False},
+    'psh': {'load_curve': PSH_LOAD, 'load_scale': 6, 'load_offset': -20, 'ylim': (-100, 100), 'fontsize': 14, 'dpi': 400, 'zero_line': True},
+}
+# Samples shown by the level graphs
+POWER_HISTORY_LENGTH = 11
+# The tight_layout margin as a fraction of the figure
+GRAPH_LAYOUT_PAD = (1.08 * 10 / (4 * 72), 1.08 * 10 / (3 * 72))
+# Pre-rendered load curve strips, keyed by (style, chart size)
+load_curve_strips = {}
+# Levels draw their graphs natively; False is the opt-in fallback that sends them to matplotlib on a
+# background thread (compared in --benchmark-graphs)
+NATIVE_POWER_GRAPHS = True
+power_graph_worker = None
+
 #Environment Variables
 # Global simulation parameters and OR-Tools model setup.
 N_timesteps = 24
@@ -418,64 +492,71 @@ price_values = 40 * np.array(
 # if result.termination.reason == mathopt.TerminationReason.OPTIMAL:
 #     optimal_value = result.objective_value()
 
-n = len(hours)
-c = -price_values
-A_ub = []
-b_ub = []
-
-# Constraint 1: Min release constraints (-release[h] <= -min_release)
-for h in range(n):
-    row = np.zeros(n)
-    row[h] = -1.0
-    A_ub.append(row)
-    b_ub.append(-min_release)
-
-# Constraint 2: Ramp up constraints (release[h] - release[h-1] <= max_ramp_up)
-for h in range(1, n):
-    row = np.zeros(n)
-    row[h] = 1.0
-    row[h-1] = -1.0
-    A_ub.append(row)
-    b_ub.append(max_ramp_up)
-
-# Constraint 3: Ramp down constraints (release[h-1] - release[h] <= max_ramp_down)
-for h in range(1, n):
-    row = np.zeros(n)
-    row[h-1] = 1.0
-    row[h] = -1.0
-    A_ub.append(row)
-    b_ub.append(max_ramp_down)
-
-# Convert to numpy arrays
-A_ub = np.array(A_ub)
-b_ub = np.array(b_ub)
-
-# Equality constraint: sum(release[h]) == TARGET
-A_eq = np.ones((1, n))
-b_eq = np.array([TARGET])
-
-# Solve the linear program
-result = linprog(
-    c=c,
-    A_ub=A_ub,
-    b_ub=b_ub,
-    A_eq=A_eq,
-    b_eq=b_eq,
-    bounds=(0, None),  # All variables >= 0, no upper bound
-    method='highs'  # Fast, modern solver
-)
-
-# Extract results
+# Filled in by solve_release_schedule when the Environment level first starts
 optimal_value = 0
 release_solution = None
 
-if result.success:
-    optimal_value = -result.fun  # Negate back for original maximization
-    release_solution = result.x
-    print(f"Optimal value: {optimal_value}")
-    print(f"Release schedule: {release_solution}")
-else:
-    print(f"Optimization failed: {result.message}")
+def solve_release_schedule():
+    """Solve the Environment level's optimal release schedule with linprog, once."""
+    global optimal_value, release_solution
+    if release_solution is not None:
+        return
+    n = len(hours)
+    c = -price_values
+    A_ub = []
+    b_ub = []
+
+    # Constraint 1: Min release constraints (-release[h] <= -min_release)
+    for h in range(n):
+        row = np.zeros(n)
+        row[h] = -1.0
+        A_ub.append(row)
+        b_ub.append(-min_release)
+
+    # Constraint 2: Ramp up constraints (release[h] - release[h-1] <= max_ramp_up)
+    for h in range(1, n):
+        row = np.zeros(n)
+        row[h] = 1.0
+        row[h-1] = -1.0
+        A_ub.append(row)
+        b_ub.append(max_ramp_up)
+
+    # Constraint 3: Ramp down constraints (release[h-1] - release[h] <= max_ramp_down)
+    for h in range(1, n):
+        row = np.zeros(n)
+        row[h-1] = 1.0
+        row[h] = -1.0
+        A_ub.append(row)
+        b_ub.append(max_ramp_down)
+
+    # Convert to numpy arrays
+    A_ub = np.array(A_ub)
+    b_ub = np.array(b_ub)
+
+    # Equality constraint: sum(release[h]) == TARGET
+    A_eq = np.ones((1, n))
+    b_eq = np.array([TARGET])
+
+    # Solve the linear program
+    result = linprog(
+        c=c,
+        A_ub=A_ub,
+        b_ub=b_ub,
+        A_eq=A_eq,
+        b_eq=b_eq,
+        bounds=(0, None),  # All variables >= 0, no upper bound
+        method='highs'  # Fast, modern solver
+    )
+
+    # Extract results
+
+    if result.success:
+        optimal_value = -result.fun  # Negate back for original maximization
+        release_solution = result.x
+        print(f"Optimal value: {optimal_value}")
+        print(f"Release schedule: {release_solution}")
+    else:
+        print(f"Optimization failed: {result.message}")
 
 clock = pygame.time.Clock()
 
@@ -506,6 +587,16 @@ def load_game_data():
     else:
         return False
 
+# Lines kept in each log beside the save file
+LOG_LENGTH = 100
+
+def append_log(name, line):
+    """Append a timestamped line to a log beside the save file, keeping its last LOG_LENGTH lines."""
+    log_path = SAVE_FILE.parent / name
+    entries = log_path.read_text().splitlines() if log_path.exists() else []
+    entries.append(f"{time.strftime('%Y-%m-%d %H:%M:%S')}  {line}")
+    log_path.write_text("\n".join(entries[-LOG_LENGTH:]) + "\n")
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -513,9 +604,31 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+def has_transparency(surface):
+    return bool(surface.get_flags() & pygame.SRCALPHA) and pygame.surfarray.array_alpha(surface).min() < 255
+
+def prepare_surface(surface):
+    """Convert a loaded image to the display format, keeping per-pixel alpha only when some pixel is translucent."""
+    return surface.convert_alpha() if has_transparency(surface) else surface.convert()
+
+def prepare_sprite(surface, colorkey=SPRITE_COLORKEY):
+    """Prepare a small sprite that is blitted many times per frame. A sprite whose pixels are all either opaque
+    or fully transparent becomes an RLE colorkey surface. One with soft edges keeps plain per-pixel alpha,
+    since SDL's RLE alpha blitter rounds differently and is no faster on them."""
+    alpha = pygame.surfarray.array_alpha(surface)
+    sprite = surface.convert()
+    pixels = pygame.surfarray.pixels3d(sprite)
+    if np.all((alpha == 0) | (alpha == 255)) and not np.all(pixels[alpha == 255] == colorkey, axis=-1).any():
+        pixels[alpha == 0] = colorkey
+        del pixels
+        sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+        return sprite
+    del pixels
+    return surface.convert_alpha()
+
 def load_image(filename):
     try:
-        return pygame.image.load(resource_path(filename)).convert_alpha()
+        return prepare_surface(pygame.image.load(resource_path(filename)))
     except pygame.error as e:
         print(f"Unable to load image: {e}")
         return None
@@ -527,39 +640,422 @@ def load_frames(num_frames, path_template):
     for i in range(num_frames):
         path = resource_path(path_template.format(i))
         try:
-            frame = pygame.image.load(path).convert_alpha()
+            frame = prepare_surface(pygame.image.load(path))
             frames.append(frame)
         except pygame.error as e:
             print(f"Error loading frame {i}: {e}")
             sys.exit(1)
     return frames
 
-def load_ROR_frames(num_frames, path_template):
+# How each animation loader prepares its frames: target size from the source size, rotation,
+# and the message printed before exiting when a frame cannot be loaded
+FRAME_LOADERS = {
+    'ror': {'rotate': 0, 'error': "Error loading frame",
+            'size': lambda width, height: (width*SCREEN_WIDTH/1920, height*SCREEN_HEIGHT/1080)},
+    'dam': {'rotate': 0, 'error': "Error loading frame",
+            'size': lambda width, height: (int(width*SCREEN_WIDTH/1920), int(height*SCREEN_HEIGHT/1080))},
+    'psh': {'rotate': 0, 'error': "Error loading frame",
+            'size': lambda width, height: (int(width*SCREEN_WIDTH/1920), int(height*SCREEN_HEIGHT/1080))},
+    'upper_reservoir': {'rotate': 0, 'error': "Error loading upper reservoir frame",
+                        'size': lambda width, height: (int(width*SCREEN_WIDTH/1920)/2.5, int(height*SCREEN_HEIGHT/1080)/2.5)},
+    'bar': {'rotate': 90, 'error': "Error loading bar frame",
+            'size': lambda width, height: ((width*SCREEN_WIDTH/1920)/2, (height*SCREEN_HEIGHT/1080))},
+}
+
+# Names of cv2 constants, looked up when a frame is decoded so cv2 is not imported before then
+FRAME_ROTATIONS = {90: 'ROTATE_90_COUNTERCLOCKWISE', 180: 'ROTATE_180', 270: 'ROTATE_90_CLOCKWISE'}
+FRAME_COLOR_CONVERSIONS = {
+    (1, 'RGB'): 'COLOR_GRAY2RGB', (3, 'RGB'): 'COLOR_BGR2RGB', (4, 'RGB'): 'COLOR_BGRA2RGB',
+    (1, 'RGBA'): 'COLOR_GRAY2RGBA', (3, 'RGBA'): 'COLOR_BGR2RGBA', (4, 'RGBA'): 'COLOR_BGRA2RGBA',
+}
+frame_pool = None
+frame_pool_lock = threading.Lock()
+FRAME_WINDOW = 32
+FRAME_LOOKAHEAD = 12
+# Largest per-channel difference from the backdrop that a cropped-away frame pixel may have
+DELTA_TOLERANCE = 16
+# Loaded assets kept across scenes and replays, up to this budget of unreferenced surfaces
+ASSET_BUDGET_MB = 768
+current_scene = None
+# Menu videos that fit in this many MB as I420 frames are decoded once and looped from memory:
+# about 140 MB at 960x540 and 250 MB at 1280x720; at 1600x900 (about 400 MB) they are streamed
+VIDEO_RING_BUDGET_MB = 320
+
+def scaled_frame_size(kind, width, height):
+    return tuple(int(value) for value in FRAME_LOADERS[kind]['size'](width, height))
+
+def frame_pixel_format(path_template):
+    # JPG frames are opaque even when the loader gives them an alpha channel
+    return 'RGBA' if path_template.lower().endswith('.png') else 'RGB'
+
+def decode_frame(kind, path, pixel_format):
+    """Decode, rotate and scale one frame to raw (bytes, width, height) with OpenCV.
+    It never touches the display and OpenCV releases the GIL, so frames decode in parallel on the frame pool."""
+    settings = FRAME_LOADERS[kind]
+    frame = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    if frame is None:
+        raise ValueError(f"Unable to decode {path}")
+    size = scaled_frame_size(kind, frame.shape[1], frame.shape[0])
+    if settings['rotate']:
+        frame = cv2.rotate(frame, getattr(cv2, FRAME_ROTATIONS[settings['rotate']]))
+    frame = cv2.resize(frame, size, interpolation=cv2.INTER_NEAREST)
+    channels = 1 if frame.ndim == 2 else frame.shape[2]
+    frame = cv2.cvtColor(frame, getattr(cv2, FRAME_COLOR_CONVERSIONS[(channels, pixel_format)]))
+    return frame.tobytes(), *size
+
+class FrameLoadError(Exception):
+    """A frame of a sequence that could not be read or decoded."""
+    def __init__(self, index, path, error):
+        super().__init__(f"{index} ({path}): {error}")
+        self.index = index
+        self.path = path
+        self.error = error
+
+def get_frame_pool():
+    global frame_pool
+    # The prefetcher's workers can ask for the pool at the same time
+    with frame_pool_lock:
+        if frame_pool is None:
+            frame_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="frames")
+    return frame_pool
+
+def decode_frames(kind, num_frames, path_template, parallel=True):
+    """Decode a sequence in order, across the frame pool when parallel. Raises FrameLoadError for the first frame that fails."""
+    pixel_format = frame_pixel_format(path_template)
+    paths = [resource_path(path_template.format(i)) for i in range(num_frames)]
+    jobs = [get_frame_pool().submit(decode_frame, kind, path, pixel_format) for path in paths] if parallel else []
     frames = []
-    for i in range(0, num_frames):
-        try:
-            frame_path = resource_path(path_template.format(i))
-            frame = pygame.image.load(frame_path).convert()
-            frame = pygame.transform.scale(frame, (frame.get_size()[0]*SCREEN_WIDTH/1920, frame.get_size()[1]*SCREEN_HEIGHT/1080))
-            frames.append(frame)
-        except pygame.error as e:
-            print(f"Error loading frame {i}: {e}")
-            sys.exit(1)
+    try:
+        for i, path in enumerate(paths):
+            try:
+                frames.append(jobs[i].result() if parallel else decode_frame(kind, path, pixel_format))
+            except (OSError, ValueError, cv2.error) as e:
+                raise FrameLoadError(i, path, e) from e
+        return frames
+    finally:
+        for job in jobs:
+            job.cancel()
+
+def decode_frame_sequence(kind, num_frames, path_template, parallel=True):
+    try:
+        return decode_frames(kind, num_frames, path_template, parallel)
+    except FrameLoadError as e:
+        print(f"{FRAME_LOADERS[kind]['error']} {e}")
+        sys.exit(1)
+
+def frames_to_surfaces(kind, frames, pixel_format):
+    """Turn raw frames into display-format surfaces; must run on the main thread.
+    Only PNG sequences carry alpha, JPG frames are converted as opaque surfaces."""
+    surfaces = []
+    for data, width, height in frames:
+        frame = pygame.image.frombuffer(data, (width, height), pixel_format)
+        surfaces.append(frame.convert_alpha() if pixel_format == 'RGBA' else frame.convert())
+    return surfaces
+
+def load_frame_sequence(kind, num_frames, path_template):
+    """Shared copy of an animation held by the asset registry for the running scene."""
+    return acquire_asset((path_template, (SCREEN_WIDTH, SCREEN_HEIGHT), kind), lambda: read_frame_sequence(kind, num_frames, path_template))
+
+def read_frame_sequence(kind, num_frames, path_template):
+    """Load an animation from its frame pack, decoding it and filling the pack on first use."""
+    if level_prefetcher is not None:
+        level_prefetcher.wait(kind, path_template)
+    key = frame_sequence_key(kind, num_frames, path_template)
+    frames = load_packed_frames(kind, num_frames, path_template, key)
+    if frames is None:
+        raw_frames = decode_frame_sequence(kind, num_frames, path_template)
+        if key is not None:
+            write_frame_pack(kind, path_template, raw_frames, key)
+        frames = frames_to_surfaces(kind, raw_frames, frame_pixel_format(path_template))
     return frames
 
+def get_asset_verifier():
+    """The AssetVerifier for the game's assets. Call with asset_verifier_lock held."""
+    global asset_verifier
+    if asset_verifier is None:
+        # A frozen build unpacks its assets afresh each launch, so their mtimes never match the saved state
+        asset_verifier = AssetManifest.AssetVerifier(resource_path("."), resource_path(AssetManifest.MANIFEST_PATH), str(ASSET_STATE_FILE),
+                                                     bundled=getattr(sys, 'frozen', False))
+    return asset_verifier
+
+def save_asset_state():
+    try:
+        get_asset_verifier().save()
+    except OSError as e:
+        print(f"Unable to save asset hashes: {e}")
+
+def verify_assets():
+    """Check every asset against assets/manifest.json; caches built from a changed file are rebuilt when next used."""
+    with asset_verifier_lock:
+        verifier = get_asset_verifier()
+        changed, missing = verifier.verify()
+        save_asset_state()
+    if verifier.manifest is None:
+        print(f"No {AssetManifest.MANIFEST_PATH} found; run python AssetManifest.py to build it")
+    if changed:
+        print(f"{len(changed)} assets differ from {AssetManifest.MANIFEST_PATH}, e.g. {changed[0]}")
+    if missing:
+        print(f"{len(missing)} assets listed in {AssetManifest.MANIFEST_PATH} are missing, e.g. {missing[0]}")
+    return changed, missing
+
+def frame_sequence_key(kind, num_frames, path_template):
+    """Key for a scaled sequence: its loader, target resolution and the hash of every source frame.
+    Returns None when a source frame is missing, leaving the error to the normal loader."""
+    key = hashlib.sha1(f"{kind}:{SCREEN_WIDTH}x{SCREEN_HEIGHT}:{num_frames}".encode('utf-8'))
+    with asset_verifier_lock:
+        try:
+            for i in range(num_frames):
+                key.update(get_asset_verifier().file_hash(path_template.format(i)).encode('utf-8'))
+        except OSError:
+            return None
+        finally:
+            save_asset_state()
+    return key.hexdigest()
+
+def frame_pack_path(kind, path_template):
+    name = re.sub(r'[^A-Za-z0-9]+', '_', os.path.splitext(path_template)[0].replace('{}', '')).strip('_')
+    return FRAME_PACK_DIR / f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}" / f"{kind}_{name}.pack"
+
+def load_packed_frames(kind, num_frames, path_template, key):
+    """Wrap the frames of a memory-mapped pack as surfaces, or return None if there is no up-to-date pack."""
+    if key is None:
+        return None
+    pack = open_current_pack(kind, num_frames, path_template, key)
+    if pack is None:
+        return None
+    return frames_to_surfaces(kind, [(pack.frame_bytes(i), *pack.frame_size(i)) for i in range(num_frames)], pack.format)
+
+def open_current_pack(kind, num_frames, path_template, key):
+    pack = FramePack.open_pack(frame_pack_path(kind, path_template))
+    if pack is None or len(pack) != num_frames or pack.meta.get('key') != key:
+        return None
+    return pack
+
+def write_frame_pack(kind, path_template, frames, key):
+    """Store raw scaled frames as the pack for the current resolution; a failed write only costs the cache."""
+    try:
+        FramePack.write_pack(str(frame_pack_path(kind, path_template)), frames,
+                             frame_pixel_format(path_template), {'template': path_template, 'key': key})
+    except OSError as e:
+        print(f"Unable to cache frames for {path_template}: {e}")
+
+def warm_frame_sequence(kind, num_frames, path_template, key=None):
+    """Build the pack for the current resolution unless an up-to-date one exists. Returns True if it was built.
+    Callers that already hold the sequence key pass it, so the source frames are not hashed again."""
+    if key is None:
+        key = frame_sequence_key(kind, num_frames, path_template)
+    if key is not None and open_current_pack(kind, num_frames, path_template, key) is not None:
+        return False
+    write_frame_pack(kind, path_template, decode_frame_sequence(kind, num_frames, path_template), key)
+    return True
+
+def prefetch_frame_sequence(kind, num_frames, path_template):
+    """Background job: make sure an up-to-date pack exists for a sequence and that its file is in the OS cache.
+    Errors are left for the main thread, which reports them when the level loads the sequence."""
+    key = frame_sequence_key(kind, num_frames, path_template)
+    if key is None:
+        return
+    if open_current_pack(kind, num_frames, path_template, key) is None:
+        try:
+            frames = decode_frames(kind, num_frames, path_template)
+        except FrameLoadError:
+            return
+        write_frame_pack(kind, path_template, frames, key)
+    else:
+        with open(frame_pack_path(kind, path_template), 'rb') as file:
+            while file.read(1 << 20):
+                pass
+
+class LevelPrefetcher:
+    """Prepares the animations of the level at the end of a chain while its intro and exploration screens run."""
+    def __init__(self, workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self.jobs = {}
+
+    def prefetch_level(self, level_name):
+        for kind, num_frames, path_template in LEVEL_FRAME_SEQUENCES[level_name]:
+            job_key = (kind, path_template, SCREEN_WIDTH, SCREEN_HEIGHT)
+            # On a replay the registry still holds the sequence and the level never waits for a job
+            if job_key not in self.jobs and not sequence_in_registry(kind, path_template):
+                self.jobs[job_key] = self.executor.submit(prefetch_frame_sequence, kind, num_frames, path_template)
+
+    def wait(self, kind, path_template):
+        """Block until a queued prefetch of this sequence has finished, so it is never decoded twice."""
+        job = self.jobs.pop((kind, path_template, SCREEN_WIDTH, SCREEN_HEIGHT), None)
+        if job is not None:
+            try:
+                job.result()
+            except Exception as e:
+                print(f"Prefetch of {path_template} failed: {e}")
+
+def prefetch_level(level_name):
+    global level_prefetcher
+    if level_prefetcher is None:
+        level_prefetcher = LevelPrefetcher()
+    level_prefetcher.prefetch_level(level_name)
+
+class FrameSequence:
+    """List-like animation that only keeps an LRU window of converted frames around the index being shown.
+    Frames ahead of the last index, in the current direction, are read from the pack on the frame pool."""
+    def __init__(self, kind, num_frames, path_template, window=FRAME_WINDOW, lookahead=FRAME_LOOKAHEAD):
+        if level_prefetcher is not None:
+            level_prefetcher.wait(kind, path_template)
+        key = frame_sequence_key(kind, num_frames, path_template)
+        if key is None:
+            decode_frame_sequence(kind, num_frames, path_template)  # reports the missing frame and exits
+        warm_frame_sequence(kind, num_frames, path_template, key)
+        self.pack = open_current_pack(kind, num_frames, path_template, key)
+        self.kind = kind
+        self.num_frames = num_frames
+        self.path_template = path_template
+        self.pixel_format = self.pack.format if self.pack is not None else frame_pixel_format(path_template)
+        self.window = window
+        self.lookahead = lookahead
+        self.direction = 0
+        self.surfaces = OrderedDict()
+        self.pending = {}
+
+    def __len__(self):
+        return self.num_frames
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.num_frames
+        if not 0 <= index < self.num_frames:
+            raise IndexError("frame index out of range")
+        surface = self.surfaces.get(index)
+        if surface is None:
+            job = self.pending.pop(index, None)
+            frame = job.result() if job is not None else self.read_frame(index)
+            surface = frames_to_surfaces(self.kind, [frame], self.pixel_format)[0]
+            self.surfaces[index] = surface
+            while len(self.surfaces) > self.window:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(index)
+        self.prefetch(index)
+        return surface
+
+    def read_frame(self, index):
+        """Raw (bytes, width, height) of one frame, copied out of the pack or decoded if the pack could not be written."""
+        if self.pack is not None:
+            return bytes(self.pack.frame_bytes(index)), *self.pack.frame_size(index)
+        return decode_frame(self.kind, resource_path(self.path_template.format(index)), self.pixel_format)
+
+    def prefetch(self, index):
+        """Queue the frames the animation will reach next; a direction of 0 looks both ways."""
+        if self.direction:
+            ahead = [index + self.direction * step for step in range(1, self.lookahead + 1)]
+        else:
+            ahead = [index + sign * step for step in range(1, self.lookahead // 2 + 1) for sign in (1, -1)]
+        for i in ahead:
+            if 0 <= i < self.num_frames and i not in self.surfaces and i not in self.pending:
+                self.pending[i] = get_frame_pool().submit(self.read_frame, i)
+        for i in [i for i in self.pending if abs(i - index) > self.lookahead]:
+            self.pending.pop(i).cancel()
+
+def crop_to_changes(frames, backdrop, position, covered=(), tolerance=DELTA_TOLERANCE):
+    """Crop each frame to the bounding box of the pixels that differ from the backdrop beneath it.
+    Returns (surface, offset) pairs, with a surface of None when a frame matches the backdrop. Pixels off
+    the backdrop or under a covered rect always count as changed, so cropping only ever uncovers the backdrop."""
+    rgb_mask = np.uint32(sum(backdrop.get_masks()[:3]))
+    references = {}
+    cropped = []
+    for frame in frames:
+        area = pygame.Rect(position, frame.get_size())
+        visible = area.clip(backdrop.get_rect())
+        changed = np.ones((area.height, area.width), dtype=bool)
+        if visible:
+            if visible.size not in references:
+                references[visible.size] = np.ascontiguousarray(pygame.surfarray.pixels2d(backdrop.subsurface(visible)).T & rgb_mask)
+            x, y = visible.x - area.x, visible.y - area.y
+            comparable = frame if frame.get_masks()[:3] == backdrop.get_masks()[:3] else frame.convert(backdrop)
+            # Compare packed 32-bit pixels byte by byte; a pixel changed if any of its RGB bytes moved past the tolerance
+            pixels = np.ascontiguousarray(pygame.surfarray.pixels2d(comparable).T[y:y + visible.height, x:x + visible.width] & rgb_mask)
+            difference = cv2.absdiff(pixels.view(np.uint8), references[visible.size].view(np.uint8))
+            changed[y:y + visible.height, x:x + visible.width] = cv2.threshold(difference, tolerance, 255, cv2.THRESH_BINARY)[1].view(np.uint32) != 0
+            del comparable
+        for rect in covered:
+            hidden = area.clip(rect)
+            if hidden:
+                changed[hidden.y - area.y:hidden.bottom - area.y, hidden.x - area.x:hidden.right - area.x] = True
+        if not changed.any():
+            cropped.append((None, (0, 0)))
+            continue
+        rows, columns = np.flatnonzero(changed.any(axis=1)), np.flatnonzero(changed.any(axis=0))
+        box = pygame.Rect(columns[0], rows[0], columns[-1] - columns[0] + 1, rows[-1] - rows[0] + 1)
+        cropped.append((frame.subsurface(box).copy(), box.topleft))
+    return cropped
+
+def blit_delta(target, delta_frame, position):
+    surface, (offset_x, offset_y) = delta_frame
+    if surface is not None:
+        return target.blit(surface, (position[0] + offset_x, position[1] + offset_y))
+
+def load_cropped_frames(kind, num_frames, path_template, backdrop, position, covered=()):
+    """Shared copy of a sequence cropped against its backdrop; the full frames are not kept."""
+    return acquire_asset((path_template, (SCREEN_WIDTH, SCREEN_HEIGHT), f"{kind}:cropped"),
+                         lambda: crop_to_changes(read_frame_sequence(kind, num_frames, path_template), backdrop, position, covered))
+
+def sequence_frame_size(kind, path_template):
+    """Scaled size of a sequence's frames, read from its first source frame."""
+    return scaled_frame_size(kind, *pygame.image.load(resource_path(path_template.format(0))).get_size())
+
+def load_lazy_frames(kind, num_frames, path_template):
+    return acquire_asset((path_template, (SCREEN_WIDTH, SCREEN_HEIGHT), f"{kind}:lazy"), lambda: FrameSequence(kind, num_frames, path_template))
+
+def sequence_in_registry(kind, path_template):
+    """True if the asset registry holds the sequence at this resolution, whole, cropped or lazy."""
+    return any((path_template, (SCREEN_WIDTH, SCREEN_HEIGHT), form) in asset_registry
+               for form in (kind, f"{kind}:cropped", f"{kind}:lazy"))
+
+def asset_bytes(value):
+    """Approximate memory held by a registry asset: its surfaces, or the converted window of a lazy sequence."""
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, FrameSequence):
+        return sum(asset_bytes(surface) for surface in value.surfaces.values())
+    if isinstance(value, (list, tuple)):
+        return sum(asset_bytes(item) for item in value)
+    return 0
+
+asset_registry = AssetRegistry.AssetRegistry(ASSET_BUDGET_MB * 2**20, asset_bytes)
+
+def acquire_asset(key, loader):
+    return asset_registry.acquire(current_scene, key, loader)
+
+def load_scene_image(filename):
+    """Shared, unscaled copy of an image for the running scene; callers must not draw on it."""
+    return acquire_asset((filename, None, 'image'), lambda: load_image(filename))
+
+def scene_assets(scene):
+    """Decorator: assets acquired while the scene runs are referenced by it until it returns."""
+    def wrap(function):
+        def run(*args, **kwargs):
+            global current_scene
+            previous_scene, current_scene = current_scene, scene
+            try:
+                return function(*args, **kwargs)
+            finally:
+                current_scene = previous_scene
+                asset_registry.release_scene(scene)
+                log_asset_stats(scene)
+        return run
+    return wrap
+
+def log_asset_stats(scene):
+    """Log the registry's counters to asset_registry.log once a scene has released its assets."""
+    stats = asset_registry.stats()
+    append_log("asset_registry.log", f"{scene} released: {stats['hits']} hits, {stats['misses']} misses, "
+               f"{stats['evictions']} evictions, {stats['entries']} entries ({stats['referenced']} referenced), "
+               f"{stats['bytes'] / 2**20:.0f} of {stats['budget'] / 2**20:.0f} MB")
+
+def load_ROR_frames(num_frames, path_template):
+    return load_frame_sequence('ror', num_frames, path_template)
+
 def load_dam_frames(num_frames, path_template):
     """Load and scale frames for animation."""
-    frames = []
-    for i in range(0, num_frames):
-        try:
-            frame_path = resource_path(path_template.format(i))
-            frame = pygame.image.load(frame_path).convert()
-            frame = pygame.transform.scale(frame, (int(frame.get_size()[0]*SCREEN_WIDTH/1920), int(frame.get_size()[1]*SCREEN_HEIGHT/1080)))
-            frames.append(frame)
-        except pygame.error as e:
-            print(f"Error loading frame {i}: {e}")
-            sys.exit(1)
-    return frames
+    return load_frame_sequence('dam', num_frames, path_template)
 
 def blit_centered_text(surface, text, font, y, color=(0, 0, 0)):
             rendered = font.render(text, True, color)
@@ -697,32 +1193,286 @@ def run_dialogue(scenes):
 def calculate_score(imbalance,water_waste=0,factor=55):
     return int(10000/((imbalance/factor) + (water_waste/20)))
 
-def Example_Graph(x_start=0, x_end=5, power_data=[], display=0,mode=0):
-    global LOAD_CURVE
-    x = np.linspace(x_start, x_end, 100)
-    power_x = np.linspace(x_start, x_start + 0.5, len(power_data))
-    plt.figure(figsize=(4, 3), facecolor=(0, 0, 0, 0))
-    ax = plt.gca()
+def power_graph_geometry(size):
+    """Figure size and DPI that render the 4x3 inch graph at exactly `size` pixels."""
+    width, height = int(size[0]), int(size[1])
+    dpi = width / 4
+    # Nudge the height up so Agg's integer truncation cannot drop the last row
+    return (4, (height + 0.5) / dpi), dpi
+
+def create_power_graph(style, legend_loc, size=None):
+    """Build the persistent figure for one graph style; the lines are updated in place afterwards."""
+    settings = POWER_GRAPH_STYLES[style]
+    if size is None:
+        figsize, dpi = (4, 3), settings['dpi']
+    else:
+        figsize, dpi = power_graph_geometry(size)
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor=(0, 0, 0, 0))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
     ax.set_facecolor((0, 0, 0, 0))
-    plt.plot(power_x, power_data, label='Power Generated', color='red')
-    indices = (np.arange(display, display + 100) % len(LOAD_CURVE))
-    plt.plot(x, LOAD_CURVE[indices]/30, label='Load Curve', color='white')
-    plt.xlim(x_start, x_end)
-    plt.ylim(1, 20)
-    plt.axis('off')
-
-    if mode == 0:
-        legend = plt.legend(loc='upper right', facecolor='none', edgecolor='none', fontsize=16)
-    elif mode == 2:
-        legend = plt.legend(loc='lower left', facecolor='none', edgecolor='none', fontsize=16)
+    if settings['zero_line']:
+        ax.axhline(y=0, color='white', linestyle='--', linewidth=1)
+    power_line = ax.plot([], [], label='Power Generated', color='red')[0]
+    load_line = ax.plot([], [], label='Load Curve', color='white')[0]
+    ax.set_ylim(*settings['ylim'])
+    ax.axis('off')
+
+    legend = ax.legend(loc=legend_loc, facecolor='none', edgecolor='none', fontsize=settings['fontsize'])
     for text in legend.get_texts():
         text.set_color('white')
 
-    plt.tight_layout()
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-    plt.savefig(temp_file.name, dpi=400, transparent=True)
-    plt.close()
-    return temp_file.name
+    fig.tight_layout()
+    return {
+        'figure': fig,
+        'canvas': canvas,
+        'axes': ax,
+        'power_line': power_line,
+        'load_line': load_line
+    }
+
+def draw_power_graph(style, x_start=0, x_end=5, power_data=[], display=0, legend_loc='upper right', size=None):
+    """Redraw the scrolling power graph and return a copy of its RGBA pixels with their size.
+    With a size the figure is rendered at that pixel size, otherwise at the style's print dpi."""
+    key = (style, legend_loc, size)
+    if key not in power_graphs:
+        power_graphs[key] = create_power_graph(style, legend_loc, size)
+    graph = power_graphs[key]
+    settings = POWER_GRAPH_STYLES[style]
+    load_curve = settings['load_curve']
+
+    x = np.linspace(x_start, x_end, 100)
+    power_x = np.linspace(x_start, x_start + 0.5, len(power_data))
+    graph['power_line'].set_data(power_x, power_data)
+    indices = (np.arange(display, display + 100) % len(load_curve))
+    graph['load_line'].set_data(x, (load_curve[indices]/settings['load_scale']) + settings['load_offset'])
+    graph['axes'].set_xlim(x_start, x_end)
+
+    canvas = graph['canvas']
+    canvas.draw()
+    raw_data = bytes(canvas.buffer_rgba())
+    return raw_data, canvas.get_width_height()
+
+def render_power_graph(style, x_start=0, x_end=5, power_data=[], display=0, legend_loc='upper right', size=None):
+    raw_data, size = draw_power_graph(style, x_start, x_end, power_data, display, legend_loc, size)
+    return pygame.image.frombuffer(raw_data, size, "RGBA")
+
+class PowerHistory:
+    """Fixed-size NumPy ring buffer holding the most recent power samples."""
+    def __init__(self, capacity=POWER_HISTORY_LENGTH):
+        self.samples = np.zeros(capacity)
+        self.capacity = capacity
+        self.head = 0
+        self.count = 0
+
+    def append(self, value):
+        self.samples[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def values(self):
+        """Return the stored samples, oldest first."""
+        if self.count < self.capacity:
+            return self.samples[:self.count]
+        return np.roll(self.samples, -self.head)
+
+    def __len__(self):
+        return self.count
+
+class ScrollingPowerChart:
+    """Draws the scrolling power graph with pygame at its on-screen size, matching the matplotlib look."""
+    def __init__(self, style, size, legend_loc='upper right'):
+        settings = POWER_GRAPH_STYLES[style]
+        self.size = (int(size[0]), int(size[1]))
+        width, height = self.size
+        # Points to pixels for a 4x3 inch figure stretched to this size
+        point_scale = width / (4 * 72)
+
+        # Axes area left by tight_layout around an axis-off plot
+        pad_x = width * GRAPH_LAYOUT_PAD[0]
+        pad_y = height * GRAPH_LAYOUT_PAD[1]
+        self.axes_rect = pygame.Rect(round(pad_x), round(pad_y), round(width - 2 * pad_x), round(height - 2 * pad_y))
+        y_min, y_max = settings['ylim']
+        self.y_scale = -self.axes_rect.height / (y_max - y_min)
+        self.y_offset = self.axes_rect.bottom - y_min * self.y_scale
+        self.line_width = max(1, round(1.5 * point_scale))
+
+        # The load curve never changes, so it is drawn once into a wrap-around strip
+        self.load_step = self.axes_rect.width / 99
+        self.load_length = len(settings['load_curve'])
+        key = (style, self.size)
+        if key not in load_curve_strips:
+            load_curve_strips[key] = self.draw_load_strip(settings)
+        self.load_strip = load_curve_strips[key]
+        self.power_span = self.axes_rect.width * 0.1
+
+        self.background = pygame.Surface(self.size, pygame.SRCALPHA)
+        if settings['zero_line']:
+            zero_y = self.to_pixel_y(0)
+            draw_dashed_line(self.background, (255, 255, 255), (self.axes_rect.left, zero_y), (self.axes_rect.right, zero_y),
+                             max(1, round(point_scale)), 3.7 * point_scale, 1.6 * point_scale)
+        self.draw_legend(settings['fontsize'] or 10, point_scale, legend_loc)
+        self.surface = pygame.Surface(self.size, pygame.SRCALPHA)
+
+    def to_pixel_y(self, values):
+        return self.y_offset + np.asarray(values, dtype=float) * self.y_scale
+
+    def draw_load_strip(self, settings):
+        """Draw the whole load curve plus one window of wrap-around, so any offset is a plain blit."""
+        load_curve = settings['load_curve']
+        indices = np.arange(self.load_length + 99) % self.load_length
+        load_y = self.to_pixel_y((load_curve[indices] / settings['load_scale']) + settings['load_offset'])
+        load_x = np.arange(len(indices)) * self.load_step
+        strip = pygame.Surface((int(np.ceil(load_x[-1])) + 1, self.size[1]), pygame.SRCALPHA)
+        strip.set_clip(pygame.Rect(0, self.axes_rect.top, strip.get_width(), self.axes_rect.height))
+        pygame.draw.lines(strip, (255, 255, 255), False, np.column_stack((load_x, load_y)).tolist(), self.line_width)
+        strip.set_clip(None)
+        return strip
+
+    def draw_legend(self, fontsize, point_scale, legend_loc):
+        """Pre-render the legend using matplotlib's default font and spacing."""
+        em = fontsize * point_scale
+        font = pygame.font.Font(font_manager.findfont(font_manager.FontProperties()), max(1, round(em)))
+        entries = [('Power Generated', (255, 0, 0)), ('Load Curve', (255, 255, 255))]
+        labels = [font.render(text, True, (255, 255, 255)) for text, _ in entries]
+        row_height = font.get_height()
+        handle_length = 2.0 * em
+        text_offset = handle_length + 0.8 * em
+        legend_width = 2 * 0.4 * em + text_offset + max(label.get_width() for label in labels)
+        legend_height = 2 * 0.4 * em + len(entries) * row_height + (len(entries) - 1) * 0.5 * em
+
+        if legend_loc == 'lower left':
+            left = self.axes_rect.left + 0.5 * em
+            top = self.axes_rect.bottom - 0.5 * em - legend_height
+        else:
+            left = self.axes_rect.right - 0.5 * em - legend_width
+            top = self.axes_rect.top + 0.5 * em
+
+        for i, ((_, color), label) in enumerate(zip(entries, labels)):
+            row_x = left + 0.4 * em
+            row_y = top + 0.4 * em + i * (row_height + 0.5 * em)
+            handle_y = row_y + row_height / 2
+            pygame.draw.line(self.background, color, (row_x, handle_y), (row_x + handle_length, handle_y), self.line_width)
+            self.background.blit(label, (row_x + text_offset, row_y))
+
+    def render(self, power_data, display=0):
+        """Return the chart surface for the current power history and load curve position."""
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blit(self.background, (0, 0))
+        self.surface.set_clip(self.axes_rect)
+
+        strip_x = round((display % self.load_length) * self.load_step)
+        self.surface.blit(self.load_strip, (self.axes_rect.left, 0), (strip_x, 0, self.axes_rect.width + 1, self.size[1]))
+
+        values = power_data.values() if isinstance(power_data, PowerHistory) else np.asarray(power_data, dtype=float)
+        if len(values) > 1:
+            power_x = np.linspace(self.axes_rect.left, self.axes_rect.left + self.power_span, len(values))
+            power_points = np.column_stack((power_x, self.to_pixel_y(values)))
+            pygame.draw.lines(self.surface, (255, 0, 0), False, power_points.tolist(), self.line_width)
+
+        self.surface.set_clip(None)
+        return self.surface
+
+class PowerGraphWorker:
+    """Renders matplotlib power graphs on a background thread through a single-slot, latest-wins mailbox."""
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.pending = None
+        self.result = None
+        self.submitted = 0
+        self.rendered = 0
+        self.dropped = 0
+        self.thread = threading.Thread(target=self.run, name="PowerGraphWorker", daemon=True)
+        self.thread.start()
+
+    def submit(self, key, snapshot):
+        """Queue a snapshot, replacing any snapshot the worker has not started yet."""
+        with self.condition:
+            if self.pending is not None:
+                self.dropped += 1
+            self.pending = (key, snapshot)
+            self.submitted += 1
+            self.condition.notify()
+
+    def latest(self):
+        with self.condition:
+            return self.result
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending is None:
+                    self.condition.wait()
+                key, snapshot = self.pending
+                self.pending = None
+            style, legend_loc, size = key
+            chart_id, x_start, x_end, power_data, display, frame_number = snapshot
+            raw_data, size = draw_power_graph(style, x_start, x_end, power_data, display, legend_loc, size)
+            with self.condition:
+                self.result = (chart_id, frame_number, raw_data, size)
+                self.rendered += 1
+
+def get_power_graph_worker():
+    global power_graph_worker
+    if power_graph_worker is None:
+        power_graph_worker = PowerGraphWorker()
+    return power_graph_worker
+
+class BackgroundPowerChart:
+    """Level power graph drawn by matplotlib off the game loop; shows the most recent finished frame."""
+    charts_created = 0
+
+    def __init__(self, style, size, legend_loc='upper right'):
+        self.size = (int(size[0]), int(size[1]))
+        self.key = (style, legend_loc, self.size)
+        # A replayed level's chart has the same key; the id keeps it from taking the last run's result
+        BackgroundPowerChart.charts_created += 1
+        self.chart_id = BackgroundPowerChart.charts_created
+        self.worker = get_power_graph_worker()
+        self.surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.frame_number = 0
+        self.shown_frame = None
+        self.staleness = 0
+        self.max_staleness = 0
+        self.total_staleness = 0
+
+    def render(self, power_data, display=0):
+        """Submit this frame's snapshot and return the newest chart the worker has finished."""
+        self.frame_number += 1
+        values = power_data.values() if isinstance(power_data, PowerHistory) else power_data
+        self.worker.submit(self.key, (self.chart_id, 0, 5, tuple(values), display, self.frame_number))
+
+        result = self.worker.latest()
+        if result is not None and result[0] == self.chart_id and result[1] != self.shown_frame:
+            _, self.shown_frame, raw_data, size = result
+            self.surface = pygame.image.frombuffer(raw_data, size, "RGBA")
+
+        if self.shown_frame is not None:
+            self.staleness = self.frame_number - self.shown_frame
+            self.max_staleness = max(self.max_staleness, self.staleness)
+            self.total_staleness += self.staleness
+        return self.surface
+
+    def stats(self):
+        """How far behind the game loop the shown chart is, in frames."""
+        return {
+            'frames': self.frame_number,
+            'staleness': self.staleness,
+            'max_staleness': self.max_staleness,
+            'mean_staleness': self.total_staleness / max(1, self.frame_number),
+            'rendered': self.worker.rendered,
+            'dropped': self.worker.dropped
+        }
+
+def create_power_chart(style, size, legend_loc='upper right'):
+    """Chart used by the level loops: native pygame drawing, or matplotlib on the background worker."""
+    if NATIVE_POWER_GRAPHS:
+        return ScrollingPowerChart(style, size, legend_loc)
+    return BackgroundPowerChart(style, size, legend_loc)
 
 # --- Character Select Functions ---
 def new_game():
@@ -897,33 +1647,22 @@ def draw_body_preview(body_frames, index, border_frame):
     screen.blit(body_img, (x, y))
 
 # --- Model Functions ---
+def viridis_lut():
+    """256-entry RGB viridis table, read from matplotlib the first time a power map is drawn."""
+    global VIRIDIS_LUT
+    if VIRIDIS_LUT is None:
+        VIRIDIS_LUT = (matplotlib.colormaps['viridis'](np.linspace(0, 1, 256))[:, :3] * 255).round().astype(np.uint8)
+    return VIRIDIS_LUT
+
 def draw_3d_surface(Q_val, h_val, azim, elev):
     global fig_3d, ax_3d, canvas_3d, scatter
     if fig_3d:
         plt.close(fig_3d)
 
-    if SCREEN_WIDTH == 960:
-        fig_3d = plt.figure(figsize=(4, 3), dpi=100)
-    elif SCREEN_WIDTH == 1280:
-        fig_3d = plt.figure(figsize=(5, 4), dpi=100)
-    elif SCREEN_WIDTH == 1600:
-        fig_3d = plt.figure(figsize=(6, 5), dpi=100)
-    ax_3d = fig_3d.add_subplot(111, projection='3d',computed_zorder=False)
-    fig_3d.subplots_adjust(left=0.15, right=0.85, bottom=0.2)
-    Q = np.linspace(0, 10000, 20)
-    h = np.linspace(0, 100, 20)
-    Q_grid, h_grid = np.meshgrid(Q, h)
-    P_grid = 0.00007 * Q_grid * h_grid
-    ax_3d.plot_surface(Q_grid, h_grid, P_grid, cmap='viridis', alpha=0.9)
+    # Shared with SurfaceAtlas so the pre-rendered views match the live plot
+    fig_3d, ax_3d = SurfaceAtlas.create_surface_figure(SCREEN_WIDTH)
     P_val = 0.00007 * Q_val * h_val
-    scatter = ax_3d.scatter(Q_val, h_val, P_val, color='red', s=50,depthshade=False)
-    ax_3d.set_xlabel("Flow Rate Q (cfs)", labelpad=10)
-    ax_3d.xaxis.set_major_formatter(mticker.StrMethodFormatter('{x:,.0f}'))
-    ax_3d.set_ylabel("Head h (ft)", labelpad=10)
-    ax_3d.set_zlabel("Power P (MW)", labelpad=10)
-    ax_3d.set_xlim(0, 10000)
-    ax_3d.set_ylim(0, 100)
-    ax_3d.set_zlim(0, 72)
+    scatter = ax_3d.scatter(Q_val, h_val, P_val, color='red', s=SurfaceAtlas.MARKER_SIZE,depthshade=False)
     ax_3d.view_init(elev=elev, azim=azim)
     canvas_3d = FigureCanvasAgg(fig_3d)
     canvas_3d.draw()
@@ -935,15 +1674,179 @@ def update_3d_surface(Q_val, h_val, azim, elev):
     global scatter, canvas_3d, ax_3d, fig_3d
     scatter.remove()
     P_val = 0.00007 * Q_val * h_val
-    scatter = ax_3d.scatter(Q_val, h_val, P_val, color='red', s=50,depthshade=False)
+    scatter = ax_3d.scatter(Q_val, h_val, P_val, color='red', s=SurfaceAtlas.MARKER_SIZE,depthshade=False)
     ax_3d.view_init(elev=elev, azim=azim)
     canvas_3d.draw()
     raw_data = canvas_3d.get_renderer().buffer_rgba()
     size = canvas_3d.get_width_height()
     return pygame.image.frombuffer(raw_data, size, "RGBA")
 
+def load_surface_atlas():
+    """Load the 3D view atlas for this resolution, or None if --build-surface-atlas has not built it."""
+    global surface_atlas
+    atlas_dir = SURFACE_ATLAS_DIR / str(SCREEN_WIDTH)
+    if surface_atlas is None or surface_atlas['screen_width'] != SCREEN_WIDTH:
+        surface_atlas_views.clear()
+        surface_atlas = SurfaceAtlas.load_atlas_index(atlas_dir)
+    return surface_atlas
+
+def draw_atlas_surface(Q_val, h_val, azim, elev):
+    """Nearest pre-rendered view of the 3D surface, with the operating point projected and drawn by pygame."""
+    view = SurfaceAtlas.nearest_view(surface_atlas, azim, elev)
+    if view['file'] in surface_atlas_views:
+        surface_atlas_views.move_to_end(view['file'])
+    else:
+        surface_atlas_views[view['file']] = pygame.image.load(str(SURFACE_ATLAS_DIR / str(SCREEN_WIDTH) / view['file'])).convert()
+        if len(surface_atlas_views) > SURFACE_ATLAS_CACHED_VIEWS:
+            surface_atlas_views.popitem(last=False)
+    surface = surface_atlas_views[view['file']].copy()
+    x, y = SurfaceAtlas.project_point(view, surface.get_height(), Q_val, h_val, 0.00007 * Q_val * h_val)
+    pygame.draw.circle(surface, (255, 0, 0), (round(x), round(y)), round(surface_atlas['marker_radius']))
+    return surface
+
+class SurfaceRenderer:
+    """Software renderer for the P = 0.00007*Q*h surface: NumPy projection and depth-sorted pygame polygons."""
+    def __init__(self, screen_width):
+        figure_width, figure_height = SurfaceAtlas.FIGURE_SIZES[screen_width]
+        self.size = (int(figure_width * SurfaceAtlas.FIGURE_DPI), int(figure_height * SurfaceAtlas.FIGURE_DPI))
+        self.surface = pygame.Surface(self.size)
+        # Same axes area as subplots_adjust(left=0.15, right=0.85, bottom=0.2) with the default top of 0.88
+        self.center = np.array([self.size[0] * 0.5, self.size[1] * (1 - (0.2 + 0.88) / 2)])
+        self.scale = self.size[0] * 0.354
+        self.limits = np.array([[0, 10000], [0, 100], [0, 72]])
+        # Matplotlib's default 4:4:3 box aspect
+        self.box = np.array([1.0, 1.0, 0.75])
+
+        Q = np.linspace(0, 10000, 20)
+        h = np.linspace(0, 100, 20)
+        Q_grid, h_grid = np.meshgrid(Q, h)
+        P_grid = 0.00007 * Q_grid * h_grid
+        self.vertices = self.to_box(np.stack([Q_grid.ravel(), h_grid.ravel(), P_grid.ravel()], axis=1))
+        # Corner indices of every quad in the 20x20 mesh
+        rows, cols = np.meshgrid(np.arange(19), np.arange(19), indexing='ij')
+        corners = rows * 20 + cols
+        self.quads = np.stack([corners, corners + 1, corners + 21, corners + 20], axis=-1).reshape(-1, 4)
+
+        # Quad colors from a 256-entry viridis table, blended with the white background for alpha=0.9
+        quad_power = P_grid.ravel()[self.quads].mean(axis=1)
+        lut_index = np.round(255 * (quad_power - P_grid.min()) / (P_grid.max() - P_grid.min())).astype(int)
+        self.quad_colors = [tuple(int(c) for c in 0.9 * viridis_lut()[i] + 0.1 * 255) for i in lut_index]
+
+        self.font = pygame.font.Font(font_manager.findfont(font_manager.FontProperties()), round(10 * SurfaceAtlas.FIGURE_DPI / 72))
+        # Evenly spaced ticks that end on each axis limit, so the top of the P axis is labelled too
+        self.ticks = [[(value, f"{value:,.0f}") for value in np.linspace(low, high, count)]
+                      for (low, high), count in zip(self.limits, (6, 6, 4))]
+        self.labels = [self.font.render(text, True, BLACK) for text in ("Flow Rate Q (cfs)", "Head h (ft)", "Power P (MW)")]
+        self.marker_radius = round(SurfaceAtlas.marker_radius())
+
+    def to_box(self, points):
+        """Map data coordinates into a box centred on the origin."""
+        return ((points - self.limits[:, 0]) / (self.limits[:, 1] - self.limits[:, 0]) - 0.5) * self.box
+
+    def view_matrix(self, azim, elev):
+        """Rows are the screen right, screen up and towards-viewer directions."""
+        azim, elev = np.radians(azim), np.radians(elev)
+        return np.array([
+            [-np.sin(azim), np.cos(azim), 0],
+            [-np.sin(elev) * np.cos(azim), -np.sin(elev) * np.sin(azim), np.cos(elev)],
+            [np.cos(elev) * np.cos(azim), np.cos(elev) * np.sin(azim), np.sin(elev)]
+        ])
+
+    def project(self, points, rotation):
+        """Orthographic projection of box coordinates to pixels, returning (pixels, depth)."""
+        view = points @ rotation.T
+        pixels = np.empty((len(points), 2))
+        pixels[:, 0] = self.center[0] + view[:, 0] * self.scale
+        pixels[:, 1] = self.center[1] - view[:, 1] * self.scale
+        return pixels, view[:, 2]
+
+    def draw_panes(self, rotation):
+        """Grey back panes with grid lines, like the matplotlib 3D axes."""
+        half = self.box / 2
+        toward_viewer = rotation[2]
+        for axis in range(3):
+            # The pane on the far side of the box along this axis
+            side = -half[axis] if toward_viewer[axis] > 0 else half[axis]
+            u, v = [a for a in range(3) if a != axis]
+            corners = []
+            for cu, cv in ((-1, -1), (1, -1), (1, 1), (-1, 1)):
+                point = np.zeros(3)
+                point[axis], point[u], point[v] = side, cu * half[u], cv * half[v]
+                corners.append(point)
+            pixels, _ = self.project(np.array(corners), rotation)
+            pygame.draw.polygon(self.surface, (242, 242, 242), pixels.tolist())
+            for grid_axis, other in ((u, v), (v, u)):
+                for value, _ in self.ticks[grid_axis]:
+                    start = np.zeros(3)
+                    start[axis] = side
+                    start[grid_axis] = self.to_box(np.full(3, value, dtype=float))[grid_axis]
+                    start[other] = -half[other]
+                    end = start.copy()
+                    end[other] = half[other]
+                    line, _ = self.project(np.array([start, end]), rotation)
+                    pygame.draw.line(self.surface, (215, 215, 215), line[0], line[1])
+
+    def axis_edge(self, axis, rotation):
+        """Box edge used for an axis: the bottom edge nearest the viewer for Q and h, the leftmost upright for P."""
+        half = self.box / 2
+        edges = []
+        for a in (-1, 1):
+            for b in (-1, 1):
+                start = np.zeros(3)
+                u, v = [i for i in range(3) if i != axis]
+                start[u], start[v] = a * half[u], b * half[v]
+                start[axis] = -half[axis]
+                end = start.copy()
+                end[axis] = half[axis]
+                edges.append((start, end))
+        if axis == 2:
+            return min(edges, key=lambda edge: self.project(edge[0][None], rotation)[0][0, 0])
+        bottom = [edge for edge in edges if edge[0][2] == (-half[2] if rotation[2][2] >= 0 else half[2])]
+        return max(bottom, key=lambda edge: (edge[0] @ rotation[2]))
+
+    def draw_axes(self, rotation):
+        for axis in range(3):
+            start, end = self.axis_edge(axis, rotation)
+            edge, _ = self.project(np.array([start, end]), rotation)
+            pygame.draw.line(self.surface, BLACK, edge[0], edge[1])
+            # Ticks and labels are pushed away from the centre of the box on screen
+            middle = (edge[0] + edge[1]) / 2
+            outward = middle - self.center
+            outward = outward / max(np.linalg.norm(outward), 1e-6)
+            for value, text in self.ticks[axis]:
+                point = start.copy()
+                point[axis] = self.to_box(np.full(3, value, dtype=float))[axis]
+                tick, _ = self.project(point[None], rotation)
+                tick = tick[0]
+                pygame.draw.line(self.surface, BLACK, tick, tick + outward * 5)
+                label = self.font.render(text, True, BLACK)
+                self.surface.blit(label, label.get_rect(center=(tick + outward * 22).tolist()))
+            label = self.labels[axis]
+            if axis == 2:
+                label = pygame.transform.rotate(label, 90)
+            self.surface.blit(label, label.get_rect(center=(middle + outward * 58).tolist()))
+
+    def render(self, Q_val, h_val, azim, elev):
+        rotation = self.view_matrix(azim, elev)
+        self.surface.fill(WHITE)
+        self.draw_panes(rotation)
+
+        pixels, depth = self.project(self.vertices, rotation)
+        quad_pixels = pixels[self.quads]
+        # Painter's algorithm: farthest quads first
+        for i in np.argsort(depth[self.quads].mean(axis=1)):
+            pygame.draw.polygon(self.surface, self.quad_colors[i], quad_pixels[i].tolist())
+
+        self.draw_axes(rotation)
+        marker, _ = self.project(self.to_box(np.array([[Q_val, h_val, 0.00007 * Q_val * h_val]])), rotation)
+        pygame.draw.circle(self.surface, (255, 0, 0), marker[0].round().tolist(), self.marker_radius)
+        return self.surface
+
 def draw_colormap(Q_val, h_val):
     global fig_colormap, ax_colormap, canvas_colormap, red_dot
+    if NATIVE_COLORMAPS:
+        build_colormap_panel('model')
+        return draw_colormap_dot(Q_val, h_val)
     if fig_colormap:
         plt.close(fig_colormap)
 
@@ -968,18 +1871,133 @@ def draw_colormap(Q_val, h_val):
     fig_colormap.patch.set_alpha(0)         # transparent figure background
     ax_colormap.set_facecolor((0,0,0,0))    # transparent axes background
     canvas_colormap = FigureCanvasAgg(fig_colormap)
+    cache_colormap_background()
+    return draw_colormap_dot(Q_val, h_val)
+
+def cache_colormap_background():
+    """Rasterize the colormap figure once without its marker and keep the data-to-pixel mapping for the dot."""
+    global colormap_background, colormap_transform, colormap_axes_rect, colormap_dot_radius
+    red_dot.set_visible(False)
     canvas_colormap.draw()
-    raw_data = canvas_colormap.get_renderer().buffer_rgba()
     size = canvas_colormap.get_width_height()
-    return pygame.image.frombuffer(raw_data, size, "RGBA")
+    colormap_background = pygame.image.frombuffer(bytes(canvas_colormap.buffer_rgba()), size, "RGBA")
+
+    # Matplotlib measures pixels from the bottom edge, pygame from the top
+    flip_y = np.array([[1, 0, 0], [0, -1, size[1]], [0, 0, 1]])
+    colormap_transform = flip_y @ ax_colormap.transData.get_matrix()
+    x0, y0, x1, y1 = ax_colormap.bbox.extents
+    colormap_axes_rect = pygame.Rect(int(x0), int(size[1] - y1), int(np.ceil(x1 - x0)), int(np.ceil(y1 - y0)))
+    # 'ro' marker: half the marker size plus half its edge, in points
+    colormap_dot_radius = (red_dot.get_markersize() + red_dot.get_markeredgewidth()) / 2 * fig_colormap.dpi / 72
+
+def draw_colormap_dot(Q_val, h_val):
+    """Return the cached colormap with the operating point drawn on top."""
+    surface = colormap_background.copy()
+    x, y, _ = colormap_transform @ np.array([Q_val, h_val, 1.0])
+    center_x, center_y, radius = round(x), round(y), round(colormap_dot_radius)
+    surface.set_clip(colormap_axes_rect)
+    pygame.gfxdraw.filled_circle(surface, center_x, center_y, radius, (255, 0, 0))
+    surface.set_clip(None)
+    return surface
+
+def build_colormap_panel(panel):
+    """Rasterize a (Q, h) power map with NumPy and pygame and cache it like cache_colormap_background does."""
+    global colormap_background, colormap_transform, colormap_axes_rect, colormap_dot_radius
+    settings = COLORMAP_PANELS[panel]
+    figure_width, figure_height = settings['figsizes'][SCREEN_WIDTH]
+    width, height = int(figure_width * 100), int(figure_height * 100)
+    key = (panel, width, height)
+    if key not in colormap_layers:
+        colormap_layers[key] = draw_colormap_layers(settings, width, height)
+    heatmap, overlay, colormap_axes_rect, colormap_transform = colormap_layers[key]
+
+    colormap_background = pygame.Surface((width, height), pygame.SRCALPHA)
+    colormap_background.blit(heatmap, colormap_axes_rect)
+    colormap_background.blit(overlay, (0, 0))
+    # Same 'ro' marker as the matplotlib version: 6 pt across plus a 1 pt edge at 100 dpi
+    colormap_dot_radius = (6 + 1) / 2 * 100 / 72
+
+def draw_colormap_layers(settings, width, height):
+    """Lay out the panel the way tight_layout does and draw the heatmap and the axes/colorbar/label layer."""
+    points = lambda value: value * 100 / 72
+    font = pygame.font.Font(font_manager.findfont(font_manager.FontProperties()), round(points(10)))
+    text_color = settings['text_color']
+    pad, label_pad, tick_space = points(1.08 * 10), points(4), points(3.5 + 3.5)
+    x_ticks, y_ticks, bar_ticks = settings['ticks']
+    tick_labels = lambda ticks, formatter: [font.render(formatter.format(value), True, text_color) for value in ticks]
+    x_labels = tick_labels(x_ticks, '{:,.0f}')
+    y_labels = tick_labels(y_ticks, '{:.0f}')
+    bar_labels = tick_labels(bar_ticks, '{:.0f}')
+    x_title = font.render("Flow Rate Q (cfs)", True, text_color)
+    y_title = pygame.transform.rotate(font.render("Head h (ft)", True, text_color), 90)
+    bar_title = pygame.transform.rotate(font.render("Power P (MW)", True, text_color), 90)
+    widest = lambda labels: max([label.get_width() for label in labels], default=0)
+
+    left = pad + y_title.get_width() + label_pad + (widest(y_labels) + tick_space if y_labels else 0)
+    bottom = pad + x_title.get_height() + label_pad + (font.get_height() + tick_space if x_labels else 0)
+    top = pad + (font.get_height() / 2 if y_labels else 0)
+    right = pad + bar_title.get_width() + label_pad + (widest(bar_labels) + tick_space if bar_labels else 0)
+    # The colorbar takes 1/20 of the axes height in width and sits 1/16 of the axes width to its right
+    axes_height = height - top - bottom
+    bar_width = axes_height / 20
+    axes_width = (width - left - right - bar_width) / (1 + 1 / 16)
+    axes_rect = pygame.Rect(round(left), round(top), round(axes_width), round(axes_height))
+    bar_rect = pygame.Rect(round(left + axes_width * (1 + 1 / 16)), axes_rect.top, max(1, round(bar_width)), axes_rect.height)
+
+    # pcolormesh with shading='auto' centres a cell on every grid point, so the limits reach half a cell past the data
+    Q_cells, h_cells = settings['grid']
+    Q_half, h_half = settings['Q_max'] / (Q_cells - 1) / 2, 100 / (h_cells - 1) / 2
+    Q_limits, h_limits = (-Q_half, settings['Q_max'] + Q_half), (-h_half, 100 + h_half)
+    Q = np.linspace(0, settings['Q_max'], Q_cells)
+    h = np.linspace(0, 100, h_cells)
+    P_grid = settings['power'](Q[:, None], h[None, :])
+    P_min, P_max = P_grid.min(), P_grid.max()
+    lut_index = np.round(255 * (P_grid - P_min) / (P_max - P_min)).astype(int)
+
+    # Nearest cell for every pixel in the axes, with h increasing upwards
+    column = np.minimum((np.arange(axes_rect.width) + 0.5) * Q_cells // axes_rect.width, Q_cells - 1).astype(int)
+    row = np.minimum((axes_rect.height - np.arange(axes_rect.height) - 0.5) * h_cells // axes_rect.height, h_cells - 1).astype(int)
+    heatmap = pygame.Surface(axes_rect.size)
+    pygame.surfarray.blit_array(heatmap, viridis_lut()[lut_index[column[:, None], row[None, :]]])
+
+    overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+    bar = pygame.Surface(bar_rect.size)
+    bar_index = np.round(np.linspace(255, 0, bar_rect.height)).astype(int)
+    pygame.surfarray.blit_array(bar, np.broadcast_to(viridis_lut()[bar_index][None, :, :], (bar_rect.width, bar_rect.height, 3)))
+    overlay.blit(bar, bar_rect)
+    spine_color = WHITE if text_color == WHITE else BLACK
+    pygame.draw.rect(overlay, spine_color, axes_rect.inflate(2, 2), 1)
+    pygame.draw.rect(overlay, spine_color, bar_rect.inflate(2, 2), 1)
+
+    # Data to pixel mapping, kept as an affine matrix for draw_colormap_dot
+    x_scale = axes_rect.width / (Q_limits[1] - Q_limits[0])
+    y_scale = -axes_rect.height / (h_limits[1] - h_limits[0])
+    transform = np.array([[x_scale, 0, axes_rect.left - Q_limits[0] * x_scale],
+                          [0, y_scale, axes_rect.bottom - h_limits[0] * y_scale],
+                          [0, 0, 1]])
+    tick_length = points(3.5)
+    for value, label in zip(x_ticks, x_labels):
+        x = transform[0, 0] * value + transform[0, 2]
+        pygame.draw.line(overlay, spine_color, (x, axes_rect.bottom), (x, axes_rect.bottom + tick_length))
+        overlay.blit(label, label.get_rect(midtop=(x, axes_rect.bottom + tick_space)))
+    for value, label in zip(y_ticks, y_labels):
+        y = transform[1, 1] * value + transform[1, 2]
+        pygame.draw.line(overlay, spine_color, (axes_rect.left - tick_length, y), (axes_rect.left, y))
+        overlay.blit(label, label.get_rect(midright=(axes_rect.left - tick_space, y)))
+    for value, label in zip(bar_ticks, bar_labels):
+        y = bar_rect.bottom - (value - P_min) / (P_max - P_min) * bar_rect.height
+        pygame.draw.line(overlay, spine_color, (bar_rect.right, y), (bar_rect.right + tick_length, y))
+        overlay.blit(label, label.get_rect(midleft=(bar_rect.right + tick_space, y)))
+
+    x_title_top = axes_rect.bottom + label_pad + (font.get_height() + tick_space if x_labels else 0)
+    overlay.blit(x_title, x_title.get_rect(midtop=(axes_rect.centerx, x_title_top)))
+    overlay.blit(y_title, y_title.get_rect(topleft=(pad, axes_rect.centery - y_title.get_height() / 2)))
+    bar_title_left = bar_rect.right + label_pad + (widest(bar_labels) + tick_space if bar_labels else 0)
+    overlay.blit(bar_title, bar_title.get_rect(topleft=(bar_title_left, bar_rect.centery - bar_title.get_height() / 2)))
+    return heatmap, overlay, axes_rect, transform
 
 def update_colormap(Q_val, h_val):
-    global red_dot, canvas_colormap
-    red_dot.set_data([Q_val], [h_val])
-    canvas_colormap.draw()
-    raw_data = canvas_colormap.get_renderer().buffer_rgba()
-    size = canvas_colormap.get_width_height()
-    return pygame.image.frombuffer(raw_data, size, "RGBA")
+    return draw_colormap_dot(Q_val, h_val)
 
 # --- RoR Level Functions ---
 def draw_arrow_keys(screen, center_x, center_y, pressed_key=None):
@@ -1120,9 +2138,7 @@ def reset_RoR():
     return {
         'rotation': 90,
         'release': 0.0,
-        'power_data': [],
-        'x_start': 0,
-        'x_end': 5,
+        'power_data': PowerHistory(),
         'level_complete': False,
         'angles': [],
         'center_x': 0,
@@ -1132,34 +2148,6 @@ def reset_RoR():
         'positions': []
     }
 
-def update_RoR_graph(x_start=0, x_end=5, power_data=[], display=0,mode=0):
-    global LOAD_CURVE, SCREEN_WIDTH
-    x = np.linspace(x_start, x_end, 100)
-    power_x = np.linspace(x_start, x_start + 0.5, len(power_data))
-    plt.figure(figsize=(4, 3), facecolor=(0, 0, 0, 0))
-    ax = plt.gca()
-    ax.set_facecolor((0, 0, 0, 0))
-    plt.plot(power_x, power_data, label='Power Generated', color='red')
-    indices = (np.arange(display, display + 100) % len(LOAD_CURVE))
-    plt.plot(x, LOAD_CURVE[indices]/110, label='Load Curve', color='white')
-    plt.xlim(x_start, x_end)
-    plt.ylim(0, 6)
-    plt.axis('off')
-
-    if mode == 0:
-        legend = plt.legend(loc='upper right', facecolor='none', edgecolor='none')
-    elif mode == 2:
-        legend = plt.legend(loc='lower left', facecolor='none', edgecolor='none')
-
-    for text in legend.get_texts():
-        text.set_color('white')
-
-    plt.tight_layout()
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-    plt.savefig(temp_file.name, dpi=400, transparent=True)
-    plt.close()
-    return temp_file.name
-
 # --- Dam Level Functions ---
 def draw_controls_page_dam(screen, show_pressed_keys, show_blinking_rect):
     # Colors
@@ -1218,45 +2206,7 @@ def draw_controls_page_dam(screen, show_pressed_keys, show_blinking_rect):
     screen.blit(mouse_caption, mouse_caption_rect)
 
 def load_bar_frames():
-    frames = []
-    for i in range(BAR_IMAGE_COUNT):
-        try:
-            path = resource_path(BAR_IMAGE_PATH_TEMPLATE.format(i))
-            image = pygame.image.load(path).convert_alpha()
-            rotated_bar_image = pygame.transform.rotate(image, 90)
-            image = pygame.transform.scale(rotated_bar_image, ((image.get_size()[0]*SCREEN_WIDTH/1920)/2, (image.get_size()[1]*SCREEN_HEIGHT/1080)))
-            frames.append(image)
-        except pygame.error as e:
-            print(f"Error loading bar frame {i}: {e}")
-            sys.exit(1)
-    return frames
-
-def update_dam_graph(x_start=0, x_end=5, power_data=[], display=0):
-    global LOAD_CURVE
-    x = np.linspace(x_start, x_end, 100)
-
-    # Calculate x-values for power data
-    power_x = np.linspace(x_start, x_start + 0.5, len(power_data))
-
-    plt.figure(figsize=(4, 3), facecolor=(0, 0, 0, 0))
-    ax = plt.gca()
-    ax.set_facecolor((0, 0, 0, 0))
-    plt.plot(power_x, power_data, label='Power Generated', color='red')
-    indices = (np.arange(display, display + 100) % len(LOAD_CURVE))
-    plt.plot(x, (LOAD_CURVE[indices]/6)-15, label='Load Curve', color='white')
-    plt.xlim(x_start, x_end)
-    plt.ylim(-5, 100)
-    plt.axis('off')
-
-    legend = plt.legend(loc='upper right', facecolor='none', edgecolor='none', fontsize=14)
-    for text in legend.get_texts():
-        text.set_color('white')
-
-    plt.tight_layout()
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-    plt.savefig(temp_file.name, dpi=300, transparent=True)
-    plt.close()
-    return temp_file.name
+    return load_frame_sequence('bar', BAR_IMAGE_COUNT, BAR_IMAGE_PATH_TEMPLATE)
 
 def reset_Dam():
     """Reset game variables to initial conditions."""
@@ -1269,9 +2219,7 @@ def reset_Dam():
         'spillway_rate': 0.0,
         'wasted_water': 0.0,
         'gates': [0,0,0,0],
-        'power_data': [],
-        'x_start': 0,
-        'x_end': 5,
+        'power_data': PowerHistory(),
         'game_over': False,
         'score': 0.0,
         'elapsed_time': 0.0,
@@ -1286,6 +2234,9 @@ def volume_to_elevation(volume,a,b):
 
 def draw_dam_colormap(Q_val, h_val):
     global fig_colormap, ax_colormap, canvas_colormap, red_dot
+    if NATIVE_COLORMAPS:
+        build_colormap_panel('dam')
+        return draw_colormap_dot(Q_val, h_val)
     if fig_colormap:
         plt.close(fig_colormap)
 
@@ -1316,18 +2267,11 @@ def draw_dam_colormap(Q_val, h_val):
     fig_colormap.patch.set_alpha(0)         # transparent figure background
     ax_colormap.set_facecolor((0,0,0,0))    # transparent axes background
     canvas_colormap = FigureCanvasAgg(fig_colormap)
-    canvas_colormap.draw()
-    raw_data = canvas_colormap.get_renderer().buffer_rgba()
-    size = canvas_colormap.get_width_height()
-    return pygame.image.frombuffer(raw_data, size, "RGBA")
+    cache_colormap_background()
+    return draw_colormap_dot(Q_val, h_val)
 
 def update_dam_colormap(Q_val, h_val):
-    global red_dot, canvas_colormap
-    red_dot.set_data([Q_val], [h_val])
-    canvas_colormap.draw()
-    raw_data = canvas_colormap.get_renderer().buffer_rgba()
-    size = canvas_colormap.get_width_height()
-    return pygame.image.frombuffer(raw_data, size, "RGBA")
+    return draw_colormap_dot(Q_val, h_val)
 
 # --- PSH Level Functions ---
 def draw_controls_page_PSH(screen, show_pressed_keys, show_blinking_rect):
@@ -1386,68 +2330,24 @@ def draw_controls_page_PSH(screen, show_pressed_keys, show_blinking_rect):
     mouse_caption_rect = mouse_caption.get_rect(center=(SCREEN_WIDTH // 2, int(SCREEN_HEIGHT * 0.92)))
     screen.blit(mouse_caption, mouse_caption_rect)
 
-def load_upper_reservoir_frames(num_frames, path_template):
-    frames = []
-    for i in range(num_frames):
-        try:
-            frame_path = resource_path(path_template.format(i))
-            frame = pygame.image.load(frame_path).convert_alpha()
-            frame = pygame.transform.scale(frame, (int(frame.get_size()[0]*SCREEN_WIDTH/1920)/2.5, int(frame.get_size()[1]*SCREEN_HEIGHT/1080)/2.5))
-            frames.append(frame)
-        except pygame.error as e:
-            print(f"Error loading upper reservoir frame {i}: {e}")
-            sys.exit(1)
-    return frames
-
-def update_psh_graph(x_start=0, x_end=5, power_data=[], display=0):
-    global PSH_LOAD
-    x = np.linspace(x_start, x_end, 100)
-    power_x = np.linspace(x_start, x_start + 0.5, len(power_data))
-
-    plt.figure(figsize=(4, 3), facecolor=(0, 0, 0, 0))
-    ax = plt.gca()
-    ax.set_facecolor((0, 0, 0, 0))
-    plt.axhline(y=0, color='white', linestyle='--', linewidth=1)
-    plt.plot(power_x, power_data, label='Power Generated', color='red')
-    indices = (np.arange(display, display + 100) % len(PSH_LOAD))
-    plt.plot(x, (PSH_LOAD[indices]/6)-20, label='Load Curve', color='white')
-    plt.xlim(x_start, x_end)
-    plt.ylim(-100, 100)
-    plt.axis('off')
-
-    legend = plt.legend(loc='upper right', facecolor='none', edgecolor='none', fontsize=14)
-    for text in legend.get_texts():
-        text.set_color('white')
-
-    plt.tight_layout()
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-    plt.savefig(temp_file.name, dpi=400, transparent=True)
-    plt.close()
-    return temp_file.name
+def load_upper_reservoir_frames(num_frames, path_template, lazy=False):
+    if lazy:
+        return load_lazy_frames('upper_reservoir', num_frames, path_template)
+    return load_frame_sequence('upper_reservoir', num_frames, path_template)
 
 def reset_PSH():
     return {
         'release': 0.0,
-        'power_data': [],
+        'power_data': PowerHistory(),
         'score': 0.0,
-        'x_start': 0,
-        'x_end': 5,
         'elapsed_time': 0.0,
         'level_complete': False,
     }
 
-def load_psh_frames(num_frames, path_template):
-    frames = []
-    for i in range(num_frames):
-        try:
-            frame_path = resource_path(path_template.format(i))
-            frame = pygame.image.load(frame_path).convert_alpha()
-            frame = pygame.transform.scale(frame, (int(frame.get_size()[0]*SCREEN_WIDTH/1920), int(frame.get_size()[1]*SCREEN_HEIGHT/1080)))
-            frames.append(frame)
-        except pygame.error as e:
-            print(f"Error loading frame {i}: {e}")
-            sys.exit(1)
-    return frames
+def load_psh_frames(num_frames, path_template, lazy=False):
+    if lazy:
+        return load_lazy_frames('psh', num_frames, path_template)
+    return load_frame_sequence('psh', num_frames, path_template)
 
 # --- Environment Functions ---
 def get_bg_color(game):
@@ -1974,17 +2874,62 @@ def handle_events_env(game):
 # --- Load all assets once ---
 assets_path = "assets/Transitions"
 
-background = pygame.image.load(resource_path(os.path.join(assets_path, "Background.jpg"))).convert()
-background1 = pygame.transform.smoothscale(background, (960, 540))
-background2 = pygame.transform.smoothscale(background, (1280, 720))
-background3 = pygame.transform.smoothscale(background, (1600, 900))
-
-border_frame = load_image("assets/IKM_Assets/BorderFrame.png")
-control_panel = load_image('assets/IKM_Assets/ControlPanel.png')
-up_active = load_image('assets/IKM_Assets/UpButtonActive.png')
-up_inactive = load_image('assets/IKM_Assets/UpButtonInactive.png')
-down_active = load_image('assets/IKM_Assets/DownButtonActive.png')
-down_inactive = load_image('assets/IKM_Assets/DownButtonInactive.png')
+# --- Boot Functions ---
+# Everything below is loaded a step per frame while the opening screen fades in, so the first
+# sponsor frame only waits for the logos
+background = background1 = background2 = background3 = None
+border_frame = control_panel = up_active = up_inactive = down_active = down_inactive = None
+
+def load_background():
+    global background
+    background = pygame.image.load(resource_path(os.path.join(assets_path, "Background.jpg"))).convert()
+
+def scale_background(size):
+    global background1, background2, background3
+    scaled = pygame.transform.smoothscale(background, size)
+    if size == (960, 540):
+        background1 = scaled
+    elif size == (1280, 720):
+        background2 = scaled
+    else:
+        background3 = scaled
+
+def load_ui_frames():
+    global border_frame, control_panel
+    border_frame = load_image("assets/IKM_Assets/BorderFrame.png")
+    control_panel = load_image('assets/IKM_Assets/ControlPanel.png')
+
+def load_ui_buttons():
+    global up_active, up_inactive, down_active, down_inactive
+    up_active = load_image('assets/IKM_Assets/UpButtonActive.png')
+    up_inactive = load_image('assets/IKM_Assets/UpButtonInactive.png')
+    down_active = load_image('assets/IKM_Assets/DownButtonActive.png')
+    down_inactive = load_image('assets/IKM_Assets/DownButtonInactive.png')
+
+# Run in order; the background the opening screen fades into comes first
+boot_stages = [
+    load_background,
+    lambda: scale_background((1280, 720)),
+    verify_assets,
+    load_ui_frames,
+    load_ui_buttons,
+    lambda: scale_background((960, 540)),
+    lambda: scale_background((1600, 900)),
+]
+
+def run_boot_stage():
+    """Run the next deferred boot step; returns True while steps remain."""
+    if boot_stages:
+        boot_stages.pop(0)()
+    return bool(boot_stages)
+
+def finish_boot():
+    while run_boot_stage():
+        pass
+
+def log_boot_time():
+    """Log the time from launch to the first opening screen frame to boot_times.log."""
+    append_log("boot_times.log", f"first frame after {1000 * (time.perf_counter() - BOOT_START):.0f} ms")
 
 argonne_logo = load_image(os.path.join(assets_path, "ArgonneLogo.png"))
 nrel_logo = load_image(os.path.join(assets_path, "NRELLogo.png"))
@@ -2000,7 +2945,7 @@ doe_logo = pygame.transform.smoothscale(doe_logo, (int(doe_logo.get_width() * lo
                                              int(doe_logo.get_height() * logo_scale)))
 
 # --- Opening screen ---
-def opening_screen(background, argonne_logo, nrel_logo, doe_logo):
+def opening_screen(argonne_logo, nrel_logo, doe_logo):
     # Fonts
     font = pygame.font.Font(resource_path("assets/Fonts/Gudea-Bold.ttf"), 50)
     title_font = pygame.font.Font(resource_path("assets/Fonts/Gudea-Bold.ttf"), 140)
@@ -2035,6 +2980,7 @@ def opening_screen(background, argonne_logo, nrel_logo, doe_logo):
     hold_time = 60
     hold_counter = 0
     finished = False
+    first_frame = True
 
     # Sponsor phase
     while not finished:
@@ -2101,9 +3047,15 @@ def opening_screen(background, argonne_logo, nrel_logo, doe_logo):
                 finished = True
 
         pygame.display.flip()
+        if first_frame:
+            log_boot_time()
+            first_frame = False
+        run_boot_stage()
         clock.tick(60)
 
     # Fade in background
+    finish_boot()
+    background = background2
     bg_alpha = 0
     bg_surface = background.copy()
 
@@ -2326,8 +3278,8 @@ def character_select():
         body_border_frames.append(body_border)
 
     video_path = resource_path("assets/CYC_Assets/Background.mp4")
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
+    background_video = VideoBackground.VideoBackground(video_path, (SCREEN_WIDTH, SCREEN_HEIGHT), ring_budget=VIDEO_RING_BUDGET_MB * 2**20)
+    if not background_video.is_opened():
         print("Failed to open video.")
         sys.exit(1)
 
@@ -2342,16 +3294,9 @@ def character_select():
 
     running = True
     while running:
-        ret, frame = cap.read()
-        if not ret:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame = cap.read()
-        if not ret:
+        frame_surface = background_video.next_frame()
+        if frame_surface is None:
             break
-
-        frame = cv2.resize(frame, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_surface = pygame.surfarray.make_surface(np.flipud(np.rot90(frame)))
         screen.blit(frame_surface, (0, 0))
 
         current_time = pygame.time.get_ticks()
@@ -2419,7 +3364,7 @@ def character_select():
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                cap.release()
+                background_video.close()
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -2437,10 +3382,10 @@ def character_select():
                     # Only accept confirm if valid selection and name entered
                     if selected_character != 4 and player_name.strip() != "":
                         save_game_data()
-                        cap.release()
+                        background_video.close()
                         level_select()
                 elif exit_rect.collidepoint(event.pos):
-                    cap.release()
+                    background_video.close()
                     main_menu()
             elif event.type == pygame.MOUSEMOTION:
                 ignore_mouse_hover_until_move = False
@@ -2476,8 +3421,8 @@ def level_select():
 
     # Video background setup
     video_path = resource_path("assets/Transitions/OperatingBackground.mp4")
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
+    background_video = VideoBackground.VideoBackground(video_path, (SCREEN_WIDTH, SCREEN_HEIGHT), ring_budget=VIDEO_RING_BUDGET_MB * 2**20)
+    if not background_video.is_opened():
         print("Failed to open background video.")
         sys.exit(1)
 
@@ -2534,16 +3479,9 @@ def level_select():
 
     running = True
     while running:
-        ret, frame_img = cap.read()
-        if not ret:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame_img = cap.read()
-        if not ret:
+        background = background_video.next_frame()
+        if background is None:
             break
-
-        frame_img = cv2.resize(frame_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        frame_img = cv2.cvtColor(frame_img, cv2.COLOR_BGR2RGB)
-        background = pygame.surfarray.make_surface(np.flipud(np.rot90(frame_img)))
         screen.blit(background, (0, 0))
 
         mouse_pos = pygame.mouse.get_pos()
@@ -2619,7 +3557,7 @@ def level_select():
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 save_game_data()
-                cap.release()
+                background_video.close()
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -2638,22 +3576,26 @@ def level_select():
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if exit_rect.collidepoint(mouse_pos):
                     has_save_file = True
-                    cap.release()
+                    background_video.close()
                     main_menu()
                 for i, (rect, unlocked) in enumerate(level_rects):
                     if rect.collidepoint(mouse_pos) and unlocked:
                         selected_level = i
                         break
                 if play_rect.collidepoint(mouse_pos) and unlocked_levels[selected_level]:
+                    # Free the video's frames while the level runs; it restarts when the level returns here
+                    background_video.close()
                     if selected_level == 0:
                         intro_level()
                     elif selected_level == 1:
+                        prefetch_level('RoR_Level')
                         Level1_intro()
                         RoR_Exploration()
                         Load_Instructions(1)
                         RoR_Controls()
                         RoR_Level()
                     elif selected_level == 2:
+                        prefetch_level('Dam_Level')
                         Level2_intro()
                         Hydropower_Model()
                         Level2_intro_cont()
@@ -2662,6 +3604,7 @@ def level_select():
                         Dam_Controls()
                         Dam_Level()
                     elif selected_level == 3:
+                        prefetch_level('PSH_Level')
                         Level3_intro()
                         PSH_Exploration()
                         Load_Instructions(3)
@@ -2670,6 +3613,7 @@ def level_select():
                     elif selected_level == 4:
                         Level4_intro()
                         Environment_Level()
+                    background_video = VideoBackground.VideoBackground(video_path, (SCREEN_WIDTH, SCREEN_HEIGHT), ring_budget=VIDEO_RING_BUDGET_MB * 2**20)
 
         pygame.display.flip()
         clock.tick(60)
@@ -3055,8 +3999,11 @@ def Hydropower_Model():
 
     running = True
     first_run = True
+    exact_view = True
     slow_run = 0
     UPDATE_INTERVAL = 6  # Update plot every 6 frames
+    if not NATIVE_3D_SURFACE:
+        load_surface_atlas()
 
     font_small = pygame.font.Font(None, int(0.045 * HEIGHT))
     font_large = pygame.font.Font(None, int(0.06 * HEIGHT))
@@ -3075,14 +4022,27 @@ def Hydropower_Model():
 
         # Draw/update plot in the middle
         if first_run:
-            plot1_surface = draw_3d_surface(Q, h, azim_angle, elev_angle) 
+            if NATIVE_3D_SURFACE:
+                surface_renderer = SurfaceRenderer(SCREEN_WIDTH)
+                plot1_surface = surface_renderer.render(Q, h, azim_angle, elev_angle)
+            else:
+                plot1_surface = draw_3d_surface(Q, h, azim_angle, elev_angle) 
             plot2_surface = draw_colormap(Q, h)
             plot1_rect = plot1_surface.get_rect(center=(WIDTH // 4, int(0.5 * HEIGHT)))
             plot2_rect = plot2_surface.get_rect(center=(3 * WIDTH // 4, int(0.5 * HEIGHT)))
             first_run = False
         else:
-            if slow_run % UPDATE_INTERVAL == 0:
+            # The NumPy renderer is cheap enough to redraw every frame
+            if NATIVE_3D_SURFACE:
+                plot1_surface = surface_renderer.render(Q, h, azim_angle, elev_angle)
+            # While dragging show the nearest pre-rendered view, then render the exact angle on release
+            elif is_dragging and surface_atlas is not None:
+                plot1_surface = draw_atlas_surface(Q, h, azim_angle, elev_angle)
+                exact_view = False
+            elif slow_run % UPDATE_INTERVAL == 0 or not exact_view:
                 plot1_surface = update_3d_surface(Q, h, azim_angle, elev_angle)
+                exact_view = True
+            if slow_run % UPDATE_INTERVAL == 0:
                 plot2_surface = update_colormap(Q, h)
         slow_run += 1
 
@@ -3194,9 +4154,7 @@ def RoR_Exploration():
     graph_y = int(SCREEN_HEIGHT * 0.075)
     graph_border = pygame.transform.smoothscale(border_frame, (int(graph_width * 1.025), int(graph_height * 1.025)))
 
-    graph_filename = update_RoR_graph()
-    graph_image = load_image(graph_filename)
-    scaled_graph_image = pygame.transform.scale(graph_image, (graph_width, graph_height))
+    graph_image = ScrollingPowerChart('ror', (graph_width, graph_height)).render(PowerHistory())
 
     # Define the positions and radii of the 8 clickable circles
     clickable_circles = [
@@ -3252,7 +4210,7 @@ def RoR_Exploration():
         screen.blit(gate_caption, (frame_x + frame_size / 2 - gate_caption.get_width() / 2, frame_y - SCREEN_HEIGHT * 0.05))
         screen.blit(scaled_frame, (frame_x, frame_y))
         screen.blit(graph_border, (graph_x, graph_y))
-        screen.blit(scaled_graph_image, (graph_x, graph_y))
+        screen.blit(graph_image, (graph_x, graph_y))
 
         # Draw rotating gates
         for i, (pos_x, pos_y) in enumerate(positions):
@@ -3334,9 +4292,7 @@ def Load_Instructions(level_number):
     example_input = []
     for i in range(len(LOAD_CURVE)-1):
         example_input.append(int(LOAD_CURVE[i]/30))
-    example_data = []
-    x_start = 0
-    x_end = 5
+    example_data = PowerHistory()
     example_index = 13
     display = 0
 
@@ -3347,6 +4303,7 @@ def Load_Instructions(level_number):
     graph_border = pygame.transform.smoothscale(border_frame, (int(graph_width*1.025), int(graph_height*1.025)))
     graph_border = tint_surface(graph_border,(50,50,50))
     graph_border.set_alpha(230)
+    example_chart = ScrollingPowerChart('example', (graph_width, graph_height), 'lower left')
 
     clock = pygame.time.Clock()
     running = True
@@ -3356,17 +4313,10 @@ def Load_Instructions(level_number):
 
         example_data.append(example_input[example_index])
 
-        graph_filename = Example_Graph(x_start,x_end,example_data,display,2)
-        graph_image = load_image(graph_filename)
+        graph_image = example_chart.render(example_data, display)
 
-        scaled_graph_image = pygame.transform.scale(graph_image, (graph_width, graph_height))
         screen.blit(graph_border, (graph_x, graph_y))
-        screen.blit(scaled_graph_image, (graph_x, graph_y))
-        if len(example_data) > 10:
-                example_data = example_data[-10:]
-
-        x_start += 0.05
-        x_end += 0.05
+        screen.blit(graph_image, (graph_x, graph_y))
 
         example_index = example_index % (len(example_input)-1)
         example_index += 1
@@ -3378,7 +4328,6 @@ def Load_Instructions(level_number):
         screen.blit(Continue_green_frame, Continue_rect)
         screen.blit(Continue_text, Continue_text_rect)
 
-        os.remove(graph_filename)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 save_game_data()
@@ -3436,14 +4385,15 @@ def RoR_Controls():
         pygame.display.flip()
         clock.tick(60)
 
+@scene_assets('RoR_Level')
 def RoR_Level():
     global NUM_ROR_FRAMES, WATER_PATH_TEMPLATE, TUBE_PATH_TEMPLATE, ROR_LEVEL_DURATION, MAX_ROTATION, ROTATION_ANGLE, NUM_OVALS 
     global SCREEN_WIDTH, SCREEN_HEIGHT, level_completed, level_scores, border_frame, control_panel, up_active, up_inactive, down_active, down_inactive
-    static_image = load_image('assets/RoRStatics/RoRStatic.jpg')
-    gate_image = load_image('assets/RoRStatics/Wicket_gate.png')
-    water_image = load_image('assets/Water.png')
-    swirl_image = load_image('assets/RoRStatics/Swirl.png')
-    turbine_image = load_image('assets/RoRStatics/Turbine.png')
+    static_image = load_scene_image('assets/RoRStatics/RoRStatic.jpg')
+    gate_image = load_scene_image('assets/RoRStatics/Wicket_gate.png')
+    water_image = load_scene_image('assets/Water.png')
+    swirl_image = load_scene_image('assets/RoRStatics/Swirl.png')
+    turbine_image = load_scene_image('assets/RoRStatics/Turbine.png')
     water_frames = load_ROR_frames(NUM_ROR_FRAMES, WATER_LOWER_PATH_TEMPLATE)
     tube_frames = load_ROR_frames(NUM_ROR_FRAMES, TUBE_PATH_TEMPLATE)
     frame_index = 0
@@ -3461,6 +4411,7 @@ def RoR_Level():
     graph_x = SCREEN_WIDTH - graph_width - SCREEN_WIDTH * 0.02 
     graph_y = int(SCREEN_HEIGHT * 0.075) 
     graph_border = pygame.transform.smoothscale(border_frame, (int(graph_width*1.025), int(graph_height*1.025)))
+    power_chart = create_power_chart('ror', (graph_width, graph_height))
 
     # Button positioning
     button_width = up_active.get_width() * SCREEN_WIDTH / 1920
@@ -3569,20 +4520,13 @@ def RoR_Level():
             power_generated = truncate_float(0.001 * game_state['release'],2)
             game_state['power_data'].append(power_generated)
 
-            graph_filename = update_RoR_graph(game_state['x_start'], game_state['x_end'], game_state['power_data'], display)
-            graph_image = load_image(graph_filename)
+            graph_image = power_chart.render(game_state['power_data'], display)
             
             display = display % (len(LOAD_CURVE)-1)
             display += 1
                 
-            scaled_graph_image = pygame.transform.scale(graph_image, (graph_width, graph_height))
             screen.blit(graph_border, (graph_x, graph_y))
-            screen.blit(scaled_graph_image, (graph_x, graph_y))
-            if len(game_state['power_data']) > 10:
-                game_state['power_data'] = game_state['power_data'][-10:]
-
-            game_state['x_start'] += 0.05
-            game_state['x_end'] += 0.05
+            screen.blit(graph_image, (graph_x, graph_y))
 
             screen.blit(scaled_panel, (0, SCREEN_HEIGHT * .8))
 
@@ -3761,9 +4705,7 @@ def Dam_Exploration():
     graph_y = int(SCREEN_HEIGHT * 0.05) 
     graph_border = pygame.transform.smoothscale(border_frame, (int(graph_width*1.025), int(graph_height*1.025)))
 
-    graph_filename = update_dam_graph()
-    graph_image = load_image(graph_filename)
-    scaled_graph_image = pygame.transform.scale(graph_image, (graph_width, graph_height))
+    graph_image = ScrollingPowerChart('dam', (graph_width, graph_height)).render(PowerHistory())
 
     # Define the positions and radii of the 8 clickable circles
     clickable_circles = [
@@ -3836,7 +4778,7 @@ def Dam_Exploration():
             screen.blit(static_image, (0, 0))
             screen.blit(exploration_directions, (SCREEN_WIDTH / 2 - exploration_directions.get_width() / 2, SCREEN_HEIGHT * 0.07))
             screen.blit(graph_border, (graph_x, graph_y))
-            screen.blit(scaled_graph_image, (graph_x, graph_y))
+            screen.blit(graph_image, (graph_x, graph_y))
 
             # Draw the clickable circles with hover and click effects
             mouse_pos = pygame.mouse.get_pos()
@@ -3927,20 +4869,15 @@ def Dam_Controls():
         pygame.display.flip()
         clock.tick(60)
 
+@scene_assets('Dam_Level')
 def Dam_Level():
     global SCREEN_WIDTH, SCREEN_HEIGHT, border_frame, level_completed, level_scores
     global control_panel, up_active, up_inactive, down_active, down_inactive
     spillway_index = 0
-    spillway_frames = load_dam_frames(NUM_SPILLWAY_FRAMES, SPILLWAY_PATH_TEMPLATE)
-    water_frames = load_dam_frames(NUM_WATER_FRAMES, WATER_PATH_TEMPLATE)
     flow1_index = 0
     flow2_index = 0
     flow3_index = 0
     flow4_index = 0
-    flow1_frames = load_dam_frames(NUM_FLOW_FRAMES, FLOW_PATH_TEMPLATE)
-    flow2_frames = load_dam_frames(NUM_FLOW_FRAMES, FLOW2_PATH_TEMPLATE)
-    flow3_frames = load_dam_frames(NUM_FLOW_FRAMES, FLOW3_PATH_TEMPLATE)
-    flow4_frames = load_dam_frames(NUM_FLOW_FRAMES, FLOW4_PATH_TEMPLATE)
     turbine1_index = 0
     turbine2_index = 0
     turbine3_index = 0
@@ -3950,17 +4887,17 @@ def Dam_Level():
     turbine3_frames = load_dam_frames(NUM_TURBINE_FRAMES, TURBINE3_PATH_TEMPLATE)
     turbine4_frames = load_dam_frames(NUM_TURBINE_FRAMES, TURBINE4_PATH_TEMPLATE)
     bar_frames = load_bar_frames()
-    static_background_image = load_image('assets/DamSequences/DamStatics/DamStatics.jpg')
-    static_tube_1_image = load_image('assets/DamSequences/DamStatics/FullTube1.jpg')
-    static_tube_2_image = load_image('assets/DamSequences/DamStatics/FullTube2.jpg')
-    open_gate_image = load_image('assets/DamSequences/Gate Cuts/OpenGates.jpg')
-    open_gate2_image = load_image('assets/DamSequences/Gate Cuts 2/OpenGates2.jpg')
-    open_gate3_image = load_image('assets/DamSequences/Gate Cuts 3/OpenGates3.jpg')
-    open_gate4_image = load_image('assets/DamSequences/Gate Cuts 4/OpenGates4.jpg')
-    closed_gate_image = load_image('assets/DamSequences/Gate Cuts/ClosedGates.jpg')
-    closed_gate2_image = load_image('assets/DamSequences/Gate Cuts 2/ClosedGates2.jpg')
-    closed_gate3_image = load_image('assets/DamSequences/Gate Cuts 3/ClosedGates3.jpg')
-    closed_gate4_image = load_image('assets/DamSequences/Gate Cuts 4/ClosedGates4.jpg')
+    static_background_image = load_scene_image('assets/DamSequences/DamStatics/DamStatics.jpg')
+    static_tube_1_image = load_scene_image('assets/DamSequences/DamStatics/FullTube1.jpg')
+    static_tube_2_image = load_scene_image('assets/DamSequences/DamStatics/FullTube2.jpg')
+    open_gate_image = load_scene_image('assets/DamSequences/Gate Cuts/OpenGates.jpg')
+    open_gate2_image = load_scene_image('assets/DamSequences/Gate Cuts 2/OpenGates2.jpg')
+    open_gate3_image = load_scene_image('assets/DamSequences/Gate Cuts 3/OpenGates3.jpg')
+    open_gate4_image = load_scene_image('assets/DamSequences/Gate Cuts 4/OpenGates4.jpg')
+    closed_gate_image = load_scene_image('assets/DamSequences/Gate Cuts/ClosedGates.jpg')
+    closed_gate2_image = load_scene_image('assets/DamSequences/Gate Cuts 2/ClosedGates2.jpg')
+    closed_gate3_image = load_scene_image('assets/DamSequences/Gate Cuts 3/ClosedGates3.jpg')
+    closed_gate4_image = load_scene_image('assets/DamSequences/Gate Cuts 4/ClosedGates4.jpg')
     border_frame_image = border_frame.copy()
     control_panel_image = control_panel.copy()
     up_active_image = up_active.copy()
@@ -4004,6 +4941,7 @@ def Dam_Level():
     graph_x = SCREEN_WIDTH - graph_width - SCREEN_WIDTH * 0.02
     graph_y = int(SCREEN_HEIGHT * 0.05) 
     graph_border = pygame.transform.smoothscale(border_frame_image, (int(graph_width*1.025), int(graph_height*1.025)))
+    power_chart = create_power_chart('dam', (graph_width, graph_height))
 
     panel_width = (control_panel_image.get_size()[0] * SCREEN_WIDTH / 1920)/2
     panel_height = (control_panel_image.get_size()[1] * SCREEN_HEIGHT / 1080)/2
@@ -4058,8 +4996,8 @@ def Dam_Level():
     score_y = SCREEN_HEIGHT*0.09
 
     # Load electricity image
-    light_image = load_image("assets/Light.png")
-    light_image = pygame.transform.smoothscale(light_image, (light_image.get_size()[0]*0.05*(SCREEN_WIDTH/1280),light_image.get_size()[1]*0.05*(SCREEN_HEIGHT/720)))
+    light_image = load_scene_image("assets/Light.png")
+    light_image = prepare_sprite(pygame.transform.smoothscale(light_image, (light_image.get_size()[0]*0.05*(SCREEN_WIDTH/1280),light_image.get_size()[1]*0.05*(SCREEN_HEIGHT/720))))
     # Define light animation positions
     light_positions = [
         (SCREEN_WIDTH*0.444, SCREEN_HEIGHT*0.71),
@@ -4239,6 +5177,36 @@ def Dam_Level():
     light19_index = 12
     light20_index = 16
 
+    # Crop the water, spillway and flow frames to the part that differs from the backdrop. Everything drawn
+    # before a sequence counts as covered, so a cropped frame never uncovers anything but DamStatics.jpg
+    water_position = (int(SCREEN_WIDTH*0.0255), 0)
+    spillway_position = (int(SCREEN_WIDTH*.6172), int(SCREEN_HEIGHT*.1657))
+    light_size = light_image.get_size()
+    sections = [  # (gate, flow, turbine, lights) in the order they are drawn
+        ((0.553, 0.3478), (0.6881, 0.7714), (0.645, 0.6223), light_positions),
+        ((0.511, 0.3611), (0.6595, 0.81805), (0.6051, 0.6486), light2_positions),
+        ((0.475, 0.3767), (0.6131, 0.8406), (0.564, 0.6714), light3_positions),
+        ((0.4340, 0.3914), (0.5767, 0.8764), (0.5247, 0.7006), light4_positions),
+    ]
+    gate_images = [open_gate4_image, open_gate3_image, open_gate2_image, open_gate_image]
+    turbine_sequences = [turbine4_frames, turbine3_frames, turbine2_frames, turbine1_frames]
+    flow_templates = [FLOW4_PATH_TEMPLATE, FLOW3_PATH_TEMPLATE, FLOW2_PATH_TEMPLATE, FLOW_PATH_TEMPLATE]
+    flow_frames = []
+    covered = [pygame.Rect(water_position, sequence_frame_size('dam', WATER_PATH_TEMPLATE))]
+    water_frames = load_cropped_frames('dam', NUM_WATER_FRAMES, WATER_PATH_TEMPLATE, static_background_image, water_position)
+    spillway_frames = load_cropped_frames('dam', NUM_SPILLWAY_FRAMES, SPILLWAY_PATH_TEMPLATE, static_background_image, spillway_position, covered)
+    covered += [pygame.Rect(spillway_position, sequence_frame_size('dam', SPILLWAY_PATH_TEMPLATE)),
+                pygame.Rect((int(SCREEN_WIDTH * 0.4025), int(SCREEN_HEIGHT * 0.3480)), static_tube_1_image.get_size()),
+                pygame.Rect((int(SCREEN_WIDTH * 0.4737), int(SCREEN_HEIGHT * 0.5771)), static_tube_2_image.get_size())]
+    for i, ((gate, flow, turbine, lights), turbine_frames) in enumerate(zip(sections, turbine_sequences)):
+        covered.append(pygame.Rect((int(SCREEN_WIDTH * gate[0]), int(SCREEN_HEIGHT * gate[1])), gate_images[i].get_size()))
+        flow_position = (int(SCREEN_WIDTH * flow[0]), int(SCREEN_HEIGHT * flow[1]))
+        flow_frames.append(load_cropped_frames('dam', NUM_FLOW_FRAMES, flow_templates[i], static_background_image, flow_position, list(covered)))
+        covered.append(pygame.Rect(flow_position, sequence_frame_size('dam', flow_templates[i])))
+        covered.append(pygame.Rect((int(SCREEN_WIDTH * turbine[0]), int(SCREEN_HEIGHT * turbine[1])), turbine_frames[0].get_size()))
+        covered += [pygame.Rect(position, light_size) for position in lights]
+    flow4_frames, flow3_frames, flow2_frames, flow1_frames = flow_frames
+
     if SCREEN_WIDTH == 960:
         performance_font = pygame.font.Font(resource_path("assets/Fonts/Electrolize-Regular.ttf"), 18)
         complete_font = pygame.font.Font(resource_path("assets/Fonts/Gudea-Regular.ttf"), 42)
@@ -4259,6 +5227,7 @@ def Dam_Level():
     power_info_counter = 0
     first_run = True
     running = True
+    dirty_rects = DirtyRects.DirtyRects(screen)
     while running:
         if game_state['level_complete']:
             screen.blit(static_background_image, (0,0))
@@ -4276,6 +5245,7 @@ def Dam_Level():
 
             screen.blit(complete_label, ((SCREEN_WIDTH - complete_label.get_width()) // 2, SCREEN_HEIGHT // 3))
             screen.blit(score_label, ((SCREEN_WIDTH - score_label.get_width()) // 2, SCREEN_HEIGHT // 2))
+            dirty_rects.invalidate()
         else:
             delta_time = clock.tick(60) / 1000.0
             # Update elapsed time
@@ -4325,33 +5295,33 @@ def Dam_Level():
             # Draw the static tubes
             water_index = min(int((game_state['water_level']/MAX_WATER_LEVEL) * (126)), 126)
             water_level_image = water_frames[water_index]
-            screen.blit(water_level_image, (int(SCREEN_WIDTH*0.0255), 0))
+            dirty_rects.add(blit_delta(screen, water_level_image, water_position), key=('water', water_index))
             if game_state['spillway_rate'] > 0:
                 spillway_index = spillway_index % 24
                 spillway_index += 1
                 spillway_image = spillway_frames[spillway_index]
-                screen.blit(spillway_image, (int(SCREEN_WIDTH*.6172),int(SCREEN_HEIGHT*.1657)))
+                dirty_rects.add(blit_delta(screen, spillway_image, spillway_position), key=('spillway', spillway_index))
             else:
                 spillway_index = 0
-                screen.blit(spillway_frames[spillway_index], (int(SCREEN_WIDTH*.6172),int(SCREEN_HEIGHT*.1657)))
+                dirty_rects.add(blit_delta(screen, spillway_frames[spillway_index], spillway_position), key=('spillway', spillway_index))
             screen.blit(static_tube_1_image, (int(SCREEN_WIDTH * 0.4025), int(SCREEN_HEIGHT * 0.3480)))
             screen.blit(static_tube_2_image, (int(SCREEN_WIDTH * 0.4737), int(SCREEN_HEIGHT * 0.5771)))
             
             if game_state['gates'][3] == 0:
-                screen.blit(closed_gate4_image, (int(SCREEN_WIDTH * 0.553), int(SCREEN_HEIGHT * 0.3478)))
-                screen.blit(flow4_frames[36], (int(SCREEN_WIDTH * 0.6881), int(SCREEN_HEIGHT * 0.7714)))
-                screen.blit(turbine4_frames[turbine4_index], (int(SCREEN_WIDTH * 0.645), int(SCREEN_HEIGHT * 0.6223)))
+                dirty_rects.blit(closed_gate4_image, (int(SCREEN_WIDTH * 0.553), int(SCREEN_HEIGHT * 0.3478)), key=('gate 4', 'closed'))
+                dirty_rects.add(blit_delta(screen, flow4_frames[36], (int(SCREEN_WIDTH * 0.6881), int(SCREEN_HEIGHT * 0.7714))), key=('flow 4', 36))
+                dirty_rects.blit(turbine4_frames[turbine4_index], (int(SCREEN_WIDTH * 0.645), int(SCREEN_HEIGHT * 0.6223)), key=('turbine 4', turbine4_index))
                 light_index = 0
                 light2_index = 4
                 light3_index = 8
                 light4_index = 12
                 light5_index = 16
             else:
-                screen.blit(open_gate4_image, (int(SCREEN_WIDTH * 0.553), int(SCREEN_HEIGHT * 0.3478)))
-                screen.blit(flow4_frames[flow4_index], (int(SCREEN_WIDTH * 0.6881), int(SCREEN_HEIGHT * 0.7714)))
+                dirty_rects.blit(open_gate4_image, (int(SCREEN_WIDTH * 0.553), int(SCREEN_HEIGHT * 0.3478)), key=('gate 4', 'open'))
+                dirty_rects.add(blit_delta(screen, flow4_frames[flow4_index], (int(SCREEN_WIDTH * 0.6881), int(SCREEN_HEIGHT * 0.7714))), key=('flow 4', flow4_index))
                 flow4_index += 1
                 flow4_index = flow4_index % 35
-                screen.blit(turbine4_frames[turbine4_index], (int(SCREEN_WIDTH * 0.645), int(SCREEN_HEIGHT * 0.6223)))
+                dirty_rects.blit(turbine4_frames[turbine4_index], (int(SCREEN_WIDTH * 0.645), int(SCREEN_HEIGHT * 0.6223)), key=('turbine 4', turbine4_index))
                 turbine4_index += 1
                 turbine4_index = turbine4_index % 33
                 light_index = (light_index + 1) % len(light_positions)
@@ -4359,27 +5329,27 @@ def Dam_Level():
                 light3_index = (light3_index + 1) % len(light_positions)
                 light4_index = (light4_index + 1) % len(light_positions)
                 light5_index = (light5_index + 1) % len(light_positions)
-                screen.blit(light_image, light_positions[light_index])
-                screen.blit(light_image, light_positions[light2_index])
-                screen.blit(light_image, light_positions[light3_index])
-                screen.blit(light_image, light_positions[light4_index])
-                screen.blit(light_image, light_positions[light5_index])
+                dirty_rects.blit(light_image, light_positions[light_index])
+                dirty_rects.blit(light_image, light_positions[light2_index])
+                dirty_rects.blit(light_image, light_positions[light3_index])
+                dirty_rects.blit(light_image, light_positions[light4_index])
+                dirty_rects.blit(light_image, light_positions[light5_index])
 
             if game_state['gates'][2] == 0:
-                screen.blit(closed_gate3_image, (int(SCREEN_WIDTH * 0.511), int(SCREEN_HEIGHT * 0.3611)))
-                screen.blit(flow3_frames[36], (int(SCREEN_WIDTH * 0.6595), int(SCREEN_HEIGHT * 0.81805)))
-                screen.blit(turbine3_frames[turbine3_index], (int(SCREEN_WIDTH * 0.6051), int(SCREEN_HEIGHT * 0.6486)))
+                dirty_rects.blit(closed_gate3_image, (int(SCREEN_WIDTH * 0.511), int(SCREEN_HEIGHT * 0.3611)), key=('gate 3', 'closed'))
+                dirty_rects.add(blit_delta(screen, flow3_frames[36], (int(SCREEN_WIDTH * 0.6595), int(SCREEN_HEIGHT * 0.81805))), key=('flow 3', 36))
+                dirty_rects.blit(turbine3_frames[turbine3_index], (int(SCREEN_WIDTH * 0.6051), int(SCREEN_HEIGHT * 0.6486)), key=('turbine 3', turbine3_index))
                 light6_index = 0
                 light7_index = 4
                 light8_index = 8
                 light9_index = 12
                 light10_index = 16
             else:
-                screen.blit(open_gate3_image, (int(SCREEN_WIDTH * 0.511), int(SCREEN_HEIGHT * 0.3611)))
-                screen.blit(flow3_frames[flow3_index], (int(SCREEN_WIDTH * 0.6595), int(SCREEN_HEIGHT * 0.81805)))
+                dirty_rects.blit(open_gate3_image, (int(SCREEN_WIDTH * 0.511), int(SCREEN_HEIGHT * 0.3611)), key=('gate 3', 'open'))
+                dirty_rects.add(blit_delta(screen, flow3_frames[flow3_index], (int(SCREEN_WIDTH * 0.6595), int(SCREEN_HEIGHT * 0.81805))), key=('flow 3', flow3_index))
                 flow3_index += 1
                 flow3_index = flow3_index % 35
-                screen.blit(turbine3_frames[turbine3_index], (int(SCREEN_WIDTH * 0.6051), int(SCREEN_HEIGHT * 0.6486)))
+                dirty_rects.blit(turbine3_frames[turbine3_index], (int(SCREEN_WIDTH * 0.6051), int(SCREEN_HEIGHT * 0.6486)), key=('turbine 3', turbine3_index))
                 turbine3_index += 1
                 turbine3_index = turbine3_index % 33
                 light6_index = (light6_index + 1) % len(light2_positions)
@@ -4387,27 +5357,27 @@ def Dam_Level():
                 light8_index = (light8_index + 1) % len(light2_positions)
                 light9_index = (light9_index + 1) % len(light2_positions)
                 light10_index = (light10_index + 1) % len(light2_positions)
-                screen.blit(light_image, light2_positions[light6_index])
-                screen.blit(light_image, light2_positions[light7_index])
-                screen.blit(light_image, light2_positions[light8_index])
-                screen.blit(light_image, light2_positions[light9_index])
-                screen.blit(light_image, light2_positions[light10_index])
+                dirty_rects.blit(light_image, light2_positions[light6_index])
+                dirty_rects.blit(light_image, light2_positions[light7_index])
+                dirty_rects.blit(light_image, light2_positions[light8_index])
+                dirty_rects.blit(light_image, light2_positions[light9_index])
+                dirty_rects.blit(light_image, light2_positions[light10_index])
 
             if game_state['gates'][1] == 0:
-                screen.blit(closed_gate2_image, (int(SCREEN_WIDTH * 0.475), int(SCREEN_HEIGHT * 0.3767)))
-                screen.blit(flow2_frames[36], (int(SCREEN_WIDTH * 0.6131), int(SCREEN_HEIGHT * 0.8406)))
-                screen.blit(turbine2_frames[turbine2_index], (int(SCREEN_WIDTH * 0.564), int(SCREEN_HEIGHT * 0.6714)))
+                dirty_rects.blit(closed_gate2_image, (int(SCREEN_WIDTH * 0.475), int(SCREEN_HEIGHT * 0.3767)), key=('gate 2', 'closed'))
+                dirty_rects.add(blit_delta(screen, flow2_frames[36], (int(SCREEN_WIDTH * 0.6131), int(SCREEN_HEIGHT * 0.8406))), key=('flow 2', 36))
+                dirty_rects.blit(turbine2_frames[turbine2_index], (int(SCREEN_WIDTH * 0.564), int(SCREEN_HEIGHT * 0.6714)), key=('turbine 2', turbine2_index))
                 light11_index = 0
                 light12_index = 4
                 light13_index = 8
                 light14_index = 12
                 light15_index = 16
             else:
-                screen.blit(open_gate2_image, (int(SCREEN_WIDTH * 0.475), int(SCREEN_HEIGHT * 0.3767)))
-                screen.blit(flow2_frames[flow2_index], (int(SCREEN_WIDTH * 0.6131), int(SCREEN_HEIGHT * 0.8406)))
+                dirty_rects.blit(open_gate2_image, (int(SCREEN_WIDTH * 0.475), int(SCREEN_HEIGHT * 0.3767)), key=('gate 2', 'open'))
+                dirty_rects.add(blit_delta(screen, flow2_frames[flow2_index], (int(SCREEN_WIDTH * 0.6131), int(SCREEN_HEIGHT * 0.8406))), key=('flow 2', flow2_index))
                 flow2_index += 1
                 flow2_index = flow2_index % 35
-                screen.blit(turbine2_frames[turbine2_index], (int(SCREEN_WIDTH * 0.564), int(SCREEN_HEIGHT * 0.6714)))
+                dirty_rects.blit(turbine2_frames[turbine2_index], (int(SCREEN_WIDTH * 0.564), int(SCREEN_HEIGHT * 0.6714)), key=('turbine 2', turbine2_index))
                 turbine2_index += 1
                 turbine2_index = turbine2_index % 33
                 light11_index = (light11_index + 1) % len(light3_positions)
@@ -4415,27 +5385,27 @@ def Dam_Level():
                 light13_index = (light13_index + 1) % len(light3_positions)
                 light14_index = (light14_index + 1) % len(light3_positions)
                 light15_index = (light15_index + 1) % len(light3_positions)
-                screen.blit(light_image, light3_positions[light11_index])
-                screen.blit(light_image, light3_positions[light12_index])
-                screen.blit(light_image, light3_positions[light13_index])
-                screen.blit(light_image, light3_positions[light14_index])
-                screen.blit(light_image, light3_positions[light15_index])
+                dirty_rects.blit(light_image, light3_positions[light11_index])
+                dirty_rects.blit(light_image, light3_positions[light12_index])
+                dirty_rects.blit(light_image, light3_positions[light13_index])
+                dirty_rects.blit(light_image, light3_positions[light14_index])
+                dirty_rects.blit(light_image, light3_positions[light15_index])
 
             if game_state['gates'][0] == 0:
-                screen.blit(closed_gate_image, (int(SCREEN_WIDTH * 0.4340), int(SCREEN_HEIGHT * 0.3914)))
-                screen.blit(flow1_frames[36], (int(SCREEN_WIDTH * 0.5767), int(SCREEN_HEIGHT * 0.8764)))
-                screen.blit(turbine1_frames[turbine1_index], (int(SCREEN_WIDTH * 0.5247), int(SCREEN_HEIGHT * 0.7006)))
+                dirty_rects.blit(closed_gate_image, (int(SCREEN_WIDTH * 0.4340), int(SCREEN_HEIGHT * 0.3914)), key=('gate 1', 'closed'))
+                dirty_rects.add(blit_delta(screen, flow1_frames[36], (int(SCREEN_WIDTH * 0.5767), int(SCREEN_HEIGHT * 0.8764))), key=('flow 1', 36))
+                dirty_rects.blit(turbine1_frames[turbine1_index], (int(SCREEN_WIDTH * 0.5247), int(SCREEN_HEIGHT * 0.7006)), key=('turbine 1', turbine1_index))
                 light16_index = 0
                 light17_index = 4
                 light18_index = 8
                 light19_index = 12
                 light20_index = 16
             else:
-                screen.blit(open_gate_image, (int(SCREEN_WIDTH * 0.4340), int(SCREEN_HEIGHT * 0.3914)))
-                screen.blit(flow1_frames[flow1_index], (int(SCREEN_WIDTH * 0.5767), int(SCREEN_HEIGHT * 0.8764)))
+                dirty_rects.blit(open_gate_image, (int(SCREEN_WIDTH * 0.4340), int(SCREEN_HEIGHT * 0.3914)), key=('gate 1', 'open'))
+                dirty_rects.add(blit_delta(screen, flow1_frames[flow1_index], (int(SCREEN_WIDTH * 0.5767), int(SCREEN_HEIGHT * 0.8764))), key=('flow 1', flow1_index))
                 flow1_index += 1
                 flow1_index = flow1_index % 35
-                screen.blit(turbine1_frames[turbine1_index], (int(SCREEN_WIDTH * 0.5247), int(SCREEN_HEIGHT * 0.7006)))
+                dirty_rects.blit(turbine1_frames[turbine1_index], (int(SCREEN_WIDTH * 0.5247), int(SCREEN_HEIGHT * 0.7006)), key=('turbine 1', turbine1_index))
                 turbine1_index += 1
                 turbine1_index = turbine1_index % 33
                 light16_index = (light16_index + 1) % len(light4_positions)
@@ -4443,40 +5413,30 @@ def Dam_Level():
                 light18_index = (light18_index + 1) % len(light4_positions)
                 light19_index = (light19_index + 1) % len(light4_positions)
                 light20_index = (light20_index + 1) % len(light4_positions)
-                screen.blit(light_image, light4_positions[light16_index])
-                screen.blit(light_image, light4_positions[light17_index])
-                screen.blit(light_image, light4_positions[light18_index])
-                screen.blit(light_image, light4_positions[light19_index])
-                screen.blit(light_image, light4_positions[light20_index])
+                dirty_rects.blit(light_image, light4_positions[light16_index])
+                dirty_rects.blit(light_image, light4_positions[light17_index])
+                dirty_rects.blit(light_image, light4_positions[light18_index])
+                dirty_rects.blit(light_image, light4_positions[light19_index])
+                dirty_rects.blit(light_image, light4_positions[light20_index])
 
             # Update the graph with new x range and power data
-            graph_filename = update_dam_graph(game_state['x_start'], game_state['x_end'], game_state['power_data'], display)
-            graph_image = load_image(graph_filename)
+            graph_image = power_chart.render(game_state['power_data'], display)
 
             display = display % (len(LOAD_CURVE)-1)
             display += 1
 
-            scaled_graph_image = pygame.transform.scale(graph_image, (graph_width, graph_height))
             screen.blit(graph_border, (graph_x, graph_y))
-            screen.blit(scaled_graph_image, (graph_x, graph_y))
-
-             # Trim power data to match the visible window
-            if len(game_state['power_data']) > 10:
-                game_state['power_data'] = game_state['power_data'][-10:]
-
-            # Update the x range to simulate movement
-            game_state['x_start'] += 0.05
-            game_state['x_end'] += 0.05
+            dirty_rects.blit(graph_image, (graph_x, graph_y))
 
             # Display the water wasted
             waste_status = f"Average Water Spilled: {int(2000*(game_state['wasted_water']/game_state['elapsed_time']))} cfs"
             waste_label = performance_font.render(waste_status, True, (255, 255, 255))
-            screen.blit(waste_label, (SCREEN_WIDTH*0.01, SCREEN_HEIGHT*0.13))
+            dirty_rects.blit(waste_label, (SCREEN_WIDTH*0.01, SCREEN_HEIGHT*0.13), key=waste_status)
 
             # Display elapsed time
             time_status = f"Time Remaining: {DAM_LEVEL_DURATION - int(game_state['elapsed_time'])} sec"
             time_label = performance_font.render(time_status, True, (255, 255, 255))
-            screen.blit(time_label, (SCREEN_WIDTH*0.01, SCREEN_HEIGHT*0.01))
+            dirty_rects.blit(time_label, (SCREEN_WIDTH*0.01, SCREEN_HEIGHT*0.01), key=time_status)
 
             # Calculate the load difference
             load_difference = truncate_float(power_generated - ((LOAD_CURVE[(display+10)%240]/6)-15), 2)
@@ -4488,7 +5448,7 @@ def Dam_Level():
             performance_label = performance_font.render(performance_text, True, (255, 255, 255))
 
             # Blit the performance label to the screen
-            screen.blit(performance_label, (performance_x, performance_y))
+            dirty_rects.blit(performance_label, (performance_x, performance_y), key=performance_text)
 
             # Update the score
             game_state['score'] += abs(load_difference)
@@ -4500,15 +5460,15 @@ def Dam_Level():
             score_label = performance_font.render(score_text, True, (255, 255, 255))
 
             # Blit the score label to the screen
-            screen.blit(score_label, (score_x, score_y))
+            dirty_rects.blit(score_label, (score_x, score_y), key=score_text)
             
             # Draw the control panel
             if game_state['water_level'] == 0:
-                screen.blit(red_panel, (panel_x, panel_y))
-                screen.blit(warning_font.render("Warning: The reservoir has reached dead pool!", True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.75))
+                dirty_rects.blit(red_panel, (panel_x, panel_y), key='red panel')
+                dirty_rects.blit(warning_font.render("Warning: The reservoir has reached dead pool!", True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.75), key="Warning: The reservoir has reached dead pool!")
             elif game_state['spillway_rate'] > 0:
-                screen.blit(orange_panel, (panel_x, panel_y))
-                screen.blit(warning_font.render("Warning: Water is being spilled!", True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.75))
+                dirty_rects.blit(orange_panel, (panel_x, panel_y), key='orange panel')
+                dirty_rects.blit(warning_font.render("Warning: Water is being spilled!", True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.75), key="Warning: Water is being spilled!")
             else:
                 screen.blit(scaled_panel, (panel_x, panel_y))
 
@@ -4528,7 +5488,7 @@ def Dam_Level():
                 if first_run:
                     text_x = panel_x + panel_width * 0.05  # Left margin
                 text_y = panel_y + left_spacing * (i + 1) + SCREEN_HEIGHT*0.01
-                screen.blit(text_surface, (text_x, text_y))
+                dirty_rects.blit(text_surface, (text_x, text_y), key=line)
 
             screen.blit(level_surface, (SCREEN_WIDTH * 0.235, SCREEN_HEIGHT * 0.82))
 
@@ -4544,9 +5504,9 @@ def Dam_Level():
                 gate_surface.fill((0, 206, 244, alpha))  # Blue with variable transparency
 
                 x = start_x + i * (square_size + spacing_between_squares)
-                screen.blit(gate_surface, (x, start_y))
+                dirty_rects.blit(gate_surface, (x, start_y), key=('gate square', i, gate_open))
 
-            screen.blit(bar_image, (int(SCREEN_WIDTH * 0.285), int(SCREEN_HEIGHT * 0.83)))
+            dirty_rects.blit(bar_image, (int(SCREEN_WIDTH * 0.285), int(SCREEN_HEIGHT * 0.83)), key=('bar', bar_index))
 
             # Decide whether buttons should be active
             all_open = all(g == 1 for g in game_state['gates'])
@@ -4556,8 +5516,8 @@ def Dam_Level():
             down_image = down_inactive_image if all_closed else down_active_image
 
             # Scale and draw buttons
-            screen.blit(up_image, up_button_rect.topleft)
-            screen.blit(down_image, down_button_rect.topleft)
+            dirty_rects.blit(up_image, up_button_rect.topleft, key=('up button', all_open))
+            dirty_rects.blit(down_image, down_button_rect.topleft, key=('down button', all_closed))
 
             # Draw exit button
             screen.blit(exit_red_frame, exit_rect)
@@ -4578,13 +5538,11 @@ def Dam_Level():
                 screen.blit(heatmap_frame, (heatmap_rect.x - heatmap_frame.get_width()//2 + dam_heatmap.get_width()//2 - SCREEN_WIDTH*.0075, heatmap_rect.y - heatmap_frame.get_height()//2 + dam_heatmap.get_height()//2))
             else:
                 screen.blit(heatmap_frame, (heatmap_rect.x - heatmap_frame.get_width()//2 + dam_heatmap.get_width()//2 - SCREEN_WIDTH*.01, heatmap_rect.y - heatmap_frame.get_height()//2 + dam_heatmap.get_height()//2 - SCREEN_HEIGHT*.01))
-            screen.blit(dam_heatmap, heatmap_rect)
+            dirty_rects.blit(dam_heatmap, heatmap_rect, key=('heatmap', game_state['active_outer_flow'], bar_index))
             
 
             if first_run:
                 first_run = False
-            # Clean up the temporary file
-            os.remove(graph_filename)
 
         
         for event in pygame.event.get():
@@ -4592,6 +5550,8 @@ def Dam_Level():
                 save_game_data()
                 pygame.quit()
                 sys.exit()
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty_rects.invalidate()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
                     for i in range(len(game_state['gates'])):
@@ -4639,7 +5599,7 @@ def Dam_Level():
                             game_state['gates'][i] = 0
                             break
 
-        pygame.display.flip()
+        dirty_rects.present()
 
 def Level3_intro():
     global selected_character, SCREEN_WIDTH, SCREEN_HEIGHT
@@ -4713,9 +5673,7 @@ def PSH_Exploration():
     graph_y = int(SCREEN_HEIGHT * 0.1) 
     graph_border = pygame.transform.smoothscale(border_frame, (int(graph_width*1.025), int(graph_height*1.025)))
 
-    graph_filename = update_psh_graph()
-    graph_image = load_image(graph_filename)
-    scaled_graph_image = pygame.transform.scale(graph_image, (graph_width, graph_height))
+    graph_image = ScrollingPowerChart('psh', (graph_width, graph_height)).render(PowerHistory())
 
     # Define the positions and radii of the 9 clickable circles
     clickable_circles = [
@@ -4774,7 +5732,7 @@ def PSH_Exploration():
         screen.blit(upper_reservoir_image, (left_edge_x, upper_edge_y))
         screen.blit(exploration_directions, (SCREEN_WIDTH / 2 - exploration_directions.get_width() / 2, SCREEN_HEIGHT * 0.02))
         screen.blit(graph_border, (graph_x, graph_y))
-        screen.blit(scaled_graph_image, (graph_x, graph_y))
+        screen.blit(graph_image, (graph_x, graph_y))
 
         # Draw the clickable circles with hover and click effects
         mouse_pos = pygame.mouse.get_pos()
@@ -4867,31 +5825,32 @@ def PSH_Controls():
         pygame.display.flip()
         clock.tick(60)
 
+@scene_assets('PSH_Level')
 def PSH_Level():
     global SCREEN_WIDTH, SCREEN_HEIGHT, border_frame, level_completed, level_scores
     global control_panel, up_active, up_inactive, down_active, down_inactive
-    frames = load_psh_frames(NUM_PSH_FRAMES, PSH_PATH_TEMPLATE)
+    frames = load_psh_frames(NUM_PSH_FRAMES, PSH_PATH_TEMPLATE, lazy=True)
     turbine_frames = load_psh_frames(POWERHOUSE_NUM_FRAMES, POWERHOUSE_PATH_TEMPLATE)
-    upper_reservoir_frames = load_upper_reservoir_frames(NUM_PSH_FRAMES, UPPER_RESERVOIR_PATH_TEMPLATE)
-    noflow_frames = load_psh_frames(FLOW_CUT_NUM_FRAMES, FLOW_CUT_PATH_TEMPLATE)
+    upper_reservoir_frames = load_upper_reservoir_frames(NUM_PSH_FRAMES, UPPER_RESERVOIR_PATH_TEMPLATE, lazy=True)
+    noflow_frames = load_psh_frames(FLOW_CUT_NUM_FRAMES, FLOW_CUT_PATH_TEMPLATE, lazy=True)
     bar_frames = load_bar_frames()
     game_state = reset_PSH()
 
     turbine_index = 0
 
-    static_background_image = load_image('assets/PSHSequences/PSHStatics/PSHStatics.jpg')
+    static_background_image = load_scene_image('assets/PSHSequences/PSHStatics/PSHStatics.jpg')
     static_background_image = pygame.transform.scale(static_background_image, (static_background_image.get_width() * SCREEN_WIDTH / 1920, static_background_image.get_height() * SCREEN_HEIGHT / 1080))
-    upper_reservoir_image = load_image('assets/PSHSequences/PSHStatics/UpperReservoirStatics.jpg')
+    upper_reservoir_image = load_scene_image('assets/PSHSequences/PSHStatics/UpperReservoirStatics.jpg')
     upper_reservoir_image = pygame.transform.scale(upper_reservoir_image, ((upper_reservoir_image.get_width() * SCREEN_WIDTH / 1920)/2.5, (upper_reservoir_image.get_height() * SCREEN_HEIGHT / 1080)/2.5))
-    border_frame_image = load_image('assets/IKM_Assets/BorderFrame.png')
-    control_panel_image = load_image('assets/IKM_Assets/ControlPanel.png')
+    border_frame_image = load_scene_image('assets/IKM_Assets/BorderFrame.png')
+    control_panel_image = load_scene_image('assets/IKM_Assets/ControlPanel.png')
 
     up_active_image = up_active.copy()
     up_inactive_image = up_inactive.copy()
     down_active_image = down_active.copy()
     down_inactive_image = down_inactive.copy()
 
-    blue_arrow_image = load_image("assets/BlueArrow.png")
+    blue_arrow_image = load_scene_image("assets/BlueArrow.png")
     blue_arrow_image = pygame.transform.scale(blue_arrow_image, (blue_arrow_image.get_size()[0]*SCREEN_WIDTH*0.000125, blue_arrow_image.get_size()[1]*SCREEN_HEIGHT*0.000111))
 
     upper_reservoir_frame_index = 100
@@ -4940,10 +5899,11 @@ def PSH_Level():
     graph_x = SCREEN_WIDTH - graph_width - SCREEN_WIDTH * 0.01
     graph_y = int(SCREEN_HEIGHT * 0.1) 
     graph_border = pygame.transform.smoothscale(border_frame_image, (int(graph_width*1.025), int(graph_height*1.025)))
+    power_chart = create_power_chart('psh', (graph_width, graph_height))
 
     # Load electricity image
-    light_image = load_image("assets/Light.png")
-    light_image = pygame.transform.smoothscale(light_image, (light_image.get_size()[0]*0.05*(SCREEN_WIDTH/1280),light_image.get_size()[1]*0.05*(SCREEN_HEIGHT/720)))
+    light_image = load_scene_image("assets/Light.png")
+    light_image = prepare_sprite(pygame.transform.smoothscale(light_image, (light_image.get_size()[0]*0.05*(SCREEN_WIDTH/1280),light_image.get_size()[1]*0.05*(SCREEN_HEIGHT/720))))
     # Define light animation positions
     light_positions = [
         (SCREEN_WIDTH * 0.402, 0),
@@ -5070,6 +6030,7 @@ def PSH_Level():
     clock = pygame.time.Clock()
     running = True
 
+    dirty_rects = DirtyRects.DirtyRects(screen)
     while running:
         if game_state['level_complete']:
             screen.blit(static_background_image, (0,0))
@@ -5087,6 +6048,7 @@ def PSH_Level():
 
             screen.blit(complete_label, ((SCREEN_WIDTH - complete_label.get_width()) // 2, SCREEN_HEIGHT // 3))
             screen.blit(score_label, ((SCREEN_WIDTH - score_label.get_width()) // 2, SCREEN_HEIGHT // 2))
+            dirty_rects.invalidate()
         else:
             game_state['elapsed_time'] += clock.tick(60) / 1000.0  # Convert milliseconds to seconds
             if game_state['elapsed_time'] >= PSH_LEVEL_DURATION:
@@ -5108,6 +6070,10 @@ def PSH_Level():
 
             # Convert to int for indexing frames
             upper_reservoir_frame_index_int = int(upper_reservoir_frame_index)
+            # Releasing fills the upper reservoir frames forward and runs the no-flow frames backward
+            release_direction = (game_state['release'] > 0) - (game_state['release'] < 0)
+            frames.direction = upper_reservoir_frames.direction = release_direction
+            noflow_frames.direction = -release_direction
             # Convert to int for index comparison
             current_index_int = int(upper_reservoir_frame_index)
             previous_index_int = int(previous_upper_reservoir_index)
@@ -5147,32 +6113,32 @@ def PSH_Level():
                         light3_index = (light3_index + 1) % len(light_positions)
                         light4_index = (light4_index + 1) % len(light_positions)
                         light5_index = (light5_index + 1) % len(light_positions)
-                        screen.blit(light_image, light_positions[light_index])
-                        screen.blit(light_image, light_positions[light2_index])
-                        screen.blit(light_image, light_positions[light3_index])
-                        screen.blit(light_image, light_positions[light4_index])
-                        screen.blit(light_image, light_positions[light5_index])
-                        screen.blit(light_image, light2_positions[light_index])
-                        screen.blit(light_image, light2_positions[light2_index])
-                        screen.blit(light_image, light2_positions[light3_index])
-                        screen.blit(light_image, light2_positions[light4_index])
-                        screen.blit(light_image, light2_positions[light5_index])
+                        dirty_rects.blit(light_image, light_positions[light_index])
+                        dirty_rects.blit(light_image, light_positions[light2_index])
+                        dirty_rects.blit(light_image, light_positions[light3_index])
+                        dirty_rects.blit(light_image, light_positions[light4_index])
+                        dirty_rects.blit(light_image, light_positions[light5_index])
+                        dirty_rects.blit(light_image, light2_positions[light_index])
+                        dirty_rects.blit(light_image, light2_positions[light2_index])
+                        dirty_rects.blit(light_image, light2_positions[light3_index])
+                        dirty_rects.blit(light_image, light2_positions[light4_index])
+                        dirty_rects.blit(light_image, light2_positions[light5_index])
                     else:
                         light_index = (light_index - 1) % len(light_positions)
                         light2_index = (light2_index - 1) % len(light_positions)
                         light3_index = (light3_index - 1) % len(light_positions)
                         light4_index = (light4_index - 1) % len(light_positions)
                         light5_index = (light5_index - 1) % len(light_positions)
-                        screen.blit(light_image, light_positions[light_index])
-                        screen.blit(light_image, light_positions[light2_index])
-                        screen.blit(light_image, light_positions[light3_index])
-                        screen.blit(light_image, light_positions[light4_index])
-                        screen.blit(light_image, light_positions[light5_index])
-                        screen.blit(light_image, light2_positions[light_index])
-                        screen.blit(light_image, light2_positions[light2_index])
-                        screen.blit(light_image, light2_positions[light3_index])
-                        screen.blit(light_image, light2_positions[light4_index])
-                        screen.blit(light_image, light2_positions[light5_index])
+                        dirty_rects.blit(light_image, light_positions[light_index])
+                        dirty_rects.blit(light_image, light_positions[light2_index])
+                        dirty_rects.blit(light_image, light_positions[light3_index])
+                        dirty_rects.blit(light_image, light_positions[light4_index])
+                        dirty_rects.blit(light_image, light_positions[light5_index])
+                        dirty_rects.blit(light_image, light2_positions[light_index])
+                        dirty_rects.blit(light_image, light2_positions[light2_index])
+                        dirty_rects.blit(light_image, light2_positions[light3_index])
+                        dirty_rects.blit(light_image, light2_positions[light4_index])
+                        dirty_rects.blit(light_image, light2_positions[light5_index])
             else:
                 light_index = 0
                 light2_index = 4
@@ -5180,16 +6146,16 @@ def PSH_Level():
                 light4_index = 12
                 light5_index = 16
 
-            screen.blit(turbine_frames[turbine_index], (SCREEN_WIDTH*0.3855, SCREEN_HEIGHT*0.5389))
-            screen.blit(frames[upper_reservoir_frame_index_int], (SCREEN_WIDTH*0.5925, SCREEN_HEIGHT*0.431))
+            dirty_rects.blit(turbine_frames[turbine_index], (SCREEN_WIDTH*0.3855, SCREEN_HEIGHT*0.5389), key=('turbine', turbine_index))
+            dirty_rects.blit(frames[upper_reservoir_frame_index_int], (SCREEN_WIDTH*0.5925, SCREEN_HEIGHT*0.431), key=('flow', upper_reservoir_frame_index_int))
             if game_state['release'] == 0:
-                    screen.blit(noflow_frames[int((NUM_PSH_FRAMES-upper_reservoir_frame_index_int)*0.73)], (SCREEN_WIDTH*0.5925, SCREEN_HEIGHT*0.431))
+                    dirty_rects.blit(noflow_frames[int((NUM_PSH_FRAMES-upper_reservoir_frame_index_int)*0.73)], (SCREEN_WIDTH*0.5925, SCREEN_HEIGHT*0.431), key=('no flow', upper_reservoir_frame_index_int))
             screen.blit(scaled_border, (border_x, border_y))
             screen.blit(upper_reservoir_image, (left_edge_x, upper_edge_y))
-            screen.blit(upper_reservoir_frames[upper_reservoir_frame_index_int], (left_edge_x, upper_edge_y+SCREEN_HEIGHT*0.09))
+            dirty_rects.blit(upper_reservoir_frames[upper_reservoir_frame_index_int], (left_edge_x, upper_edge_y+SCREEN_HEIGHT*0.09), key=('upper reservoir', upper_reservoir_frame_index_int))
             if current_index_int >= NUM_PSH_FRAMES - 1 or current_index_int <= 0:
-                screen.blit(red_panel, (0, SCREEN_HEIGHT * 0.8))
-                screen.blit(warning_font.render("Warning: Reservoir below pump/turbine intake!", True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.75))
+                dirty_rects.blit(red_panel, (0, SCREEN_HEIGHT * 0.8), key='red panel')
+                dirty_rects.blit(warning_font.render("Warning: Reservoir below pump/turbine intake!", True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.75), key="Warning: Reservoir below pump/turbine intake!")
             else:
                 screen.blit(scaled_panel, (0, SCREEN_HEIGHT * 0.8))
 
@@ -5213,31 +6179,23 @@ def PSH_Level():
             else:
                 power_status = f"Power Consumed: {int(abs(0.025*26.67*excess_power/0.65))} MW"
 
-            graph_filename = update_psh_graph(game_state['x_start'], game_state['x_end'], game_state['power_data'], display)
-            graph_image = load_image(graph_filename)
+            graph_image = power_chart.render(game_state['power_data'], display)
 
             display = display % (len(LOAD_CURVE)-1)
             display += 1
                 
 
-            scaled_graph_image = pygame.transform.scale(graph_image, (graph_width, graph_height))
             screen.blit(graph_border, (graph_x, graph_y))
-            screen.blit(scaled_graph_image, (graph_x, graph_y))
-
-            if len(game_state['power_data']) > 10:
-                game_state['power_data'] = game_state['power_data'][-10:]
-
-            game_state['x_start'] += 0.05
-            game_state['x_end'] += 0.05
+            dirty_rects.blit(graph_image, (graph_x, graph_y))
 
-            screen.blit(panel_font.render(release_status, True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.85))
-            screen.blit(panel_font.render(power_status, True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.90))
+            dirty_rects.blit(panel_font.render(release_status, True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.85), key=release_status)
+            dirty_rects.blit(panel_font.render(power_status, True, (255, 255, 255)), (SCREEN_WIDTH * 0.02, SCREEN_HEIGHT * 0.90), key=power_status)
 
             # Upper Reservoir Water Level bar
             bar_index = int((300 - upper_reservoir_frame_index_int) * (1/3))
             bar_index = min(100,bar_index)
             bar_image = bar_frames[bar_index]
-            screen.blit(bar_image, (int(SCREEN_WIDTH * 0.31), int(SCREEN_HEIGHT * 0.83)))
+            dirty_rects.blit(bar_image, (int(SCREEN_WIDTH * 0.31), int(SCREEN_HEIGHT * 0.83)), key=('bar', bar_index))
 
             # Label
             screen.blit(label_text, (label_x, label_y))
@@ -5246,8 +6204,8 @@ def PSH_Level():
             up_image = up_active_image if game_state['release'] < MAX_PSH_RELEASE and allow_release else up_inactive_image
             down_image = down_active_image if game_state['release'] > MIN_PSH_RELEASE and allow_pump else down_inactive_image
 
-            screen.blit(up_image, up_button_rect.topleft)
-            screen.blit(down_image, down_button_rect.topleft)
+            dirty_rects.blit(up_image, up_button_rect.topleft, key=('up button', up_image is up_active_image))
+            dirty_rects.blit(down_image, down_button_rect.topleft, key=('down button', down_image is down_active_image))
 
             # Get target load value from sine wave at this point in time
             target_load = (PSH_LOAD[(display+10)%len(PSH_LOAD)]/6)-20
@@ -5263,9 +6221,10 @@ def PSH_Level():
             avg_imbalance = game_state['score'] / power_index
             imbalance_text = f"Average Power Imbalance: {(1.026*avg_imbalance):.2f} MW"
             text_surface = performance_font.render(imbalance_text, True, (255, 255, 255))
-            screen.blit(text_surface, (SCREEN_WIDTH * 0.01, SCREEN_HEIGHT * 0.02))
+            dirty_rects.blit(text_surface, (SCREEN_WIDTH * 0.01, SCREEN_HEIGHT * 0.02), key=imbalance_text)
 
-            screen.blit(performance_font.render(f"Time Remaining: {PSH_LEVEL_DURATION-int(game_state['elapsed_time'])} sec", True, (255, 255, 255)), (SCREEN_WIDTH * 0.5, SCREEN_HEIGHT * 0.02))
+            time_status = f"Time Remaining: {PSH_LEVEL_DURATION-int(game_state['elapsed_time'])} sec"
+            dirty_rects.blit(performance_font.render(time_status, True, (255, 255, 255)), (SCREEN_WIDTH * 0.5, SCREEN_HEIGHT * 0.02), key=time_status)
 
             release_alpha = int(min(255, max(0, abs(release_factor/3) * 255)))
 
@@ -5279,7 +6238,7 @@ def PSH_Level():
             rotated_blue_arrow.set_alpha(release_alpha)
 
             # Draw the arrow on screen
-            screen.blit(rotated_blue_arrow, (SCREEN_WIDTH*0.18,SCREEN_HEIGHT*0.5))
+            dirty_rects.blit(rotated_blue_arrow, (SCREEN_WIDTH*0.18,SCREEN_HEIGHT*0.5), key=('arrow', game_state['release'] >= 0, release_alpha))
 
             # Draw exit button
             screen.blit(exit_red_frame, exit_rect)
@@ -5294,6 +6253,8 @@ def PSH_Level():
                 save_game_data()
                 pygame.quit()
                 sys.exit()
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty_rects.invalidate()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if game_state['level_complete']:
                     calc_score = calculate_score(game_state['score'], factor=1200)
@@ -5329,7 +6290,7 @@ def PSH_Level():
                     if game_state['release'] < MAX_PSH_RELEASE and allow_release:
                         game_state['release'] += RELEASE_STEP
                     
-        pygame.display.flip()
+        dirty_rects.present()
 
 def Level4_intro():
     global selected_character, SCREEN_WIDTH, SCREEN_HEIGHT
@@ -5361,6 +6322,7 @@ def Level4_intro():
     run_dialogue(scenes)
 
 def Environment_Level():
+    solve_release_schedule()
     game = reset_env()
     game['screen'] = pygame.display.set_mode((game['window_width'], game['window_height']))
     game['clock'] =  pygame.time.Clock()
@@ -5377,9 +6339,221 @@ def Environment_Level():
         pygame.display.flip()
         game['clock'].tick(30)
 
+# --- Developer Commands ---
+def time_per_frame(render, frames):
+    start = time.perf_counter()
+    for display in range(frames):
+        render(display)
+    return 1000 * (time.perf_counter() - start) / frames
+
+def paced_chart_cost(chart, power_data, frames, fps=60):
+    """Game loop ms/frame and mean staleness in frames of a BackgroundPowerChart rendered at the level frame rate."""
+    busy = 0.0
+    for display in range(frames):
+        start = time.perf_counter()
+        chart.render(power_data, display)
+        elapsed = time.perf_counter() - start
+        busy += elapsed
+        time.sleep(max(0.0, 1 / fps - elapsed))
+    return 1000 * busy / frames, chart.stats()['mean_staleness']
+
+def benchmark_power_graphs(frames=60):
+    """Print the per-frame cost of each way of drawing the level power graph at every supported resolution.
+    The background chart only costs the game loop its submit and blit; its lag is how many frames old the shown graph is."""
+    power_data = PowerHistory()
+    for i in range(POWER_HISTORY_LENGTH):
+        power_data.append(40 + 3 * i)
+    scaled_column = f"{POWER_GRAPH_STYLES['dam']['dpi']} dpi + scale"
+    print(f"{'Resolution':<12}{'Graph':>10}{scaled_column:>18}{'Native dpi':>13}{'pygame':>9}{'Background':>13}{'Lag':>6}  (ms/frame, frames)")
+    for width, height in ((960, 540), (1280, 720), (1600, 900)):
+        size = (int((1200 * width / 1920) / 2.8), int((900 * height / 1080) / 2.8))
+        print_size = lambda display: pygame.transform.scale(render_power_graph('dam', 0, 5, power_data.values(), display), size)
+        native_size = lambda display: render_power_graph('dam', 0, 5, power_data.values(), display, size=size)
+        chart = ScrollingPowerChart('dam', size)
+        native_chart = lambda display: chart.render(power_data, display)
+        background_cost, background_lag = paced_chart_cost(BackgroundPowerChart('dam', size), power_data, frames)
+        print(f"{f'{width}x{height}':<12}{f'{size[0]}x{size[1]}':>10}"
+              f"{time_per_frame(print_size, frames):>18.2f}{time_per_frame(native_size, frames):>13.2f}{time_per_frame(native_chart, frames):>9.2f}"
+              f"{background_cost:>13.2f}{background_lag:>6.1f}")
+
+def build_surface_atlas():
+    """Pre-render the Hydropower_Model 3D views for every supported resolution into the cache."""
+    subprocess.run([sys.executable, os.path.abspath(SurfaceAtlas.__file__), str(SURFACE_ATLAS_DIR)], check=True)
+
+def warm_frame_cache():
+    """Fill the scaled frame cache for every level animation at each supported resolution."""
+    global SCREEN_WIDTH, SCREEN_HEIGHT
+    current_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    for SCREEN_WIDTH, SCREEN_HEIGHT in SUPPORTED_RESOLUTIONS:
+        start = time.perf_counter()
+        sequences = {(kind, num_frames, path_template) for level in LEVEL_FRAME_SEQUENCES.values() for kind, num_frames, path_template in level}
+        built = sum(warm_frame_sequence(*sequence) for sequence in sorted(sequences))
+        print(f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}: built {built} of {len(sequences)} frame packs in {time.perf_counter() - start:.1f} s")
+    SCREEN_WIDTH, SCREEN_HEIGHT = current_size
+
+def benchmark_frame_loading():
+    """Time loading every PSH_Level sequence from its source files, decoded one frame at a time and across the frame pool."""
+    sequences = LEVEL_FRAME_SEQUENCES['PSH_Level']
+    print(f"{'Sequence':<76}{'Frames':>7}{'Sequential':>12}{'Parallel':>10}  (s)")
+    totals = [0, 0.0, 0.0]
+    for kind, num_frames, path_template in sequences:
+        times = []
+        for parallel in (False, True):
+            start = time.perf_counter()
+            frames_to_surfaces(kind, decode_frame_sequence(kind, num_frames, path_template, parallel), frame_pixel_format(path_template))
+            times.append(time.perf_counter() - start)
+        print(f"{path_template:<76}{num_frames:>7}{times[0]:>12.2f}{times[1]:>10.2f}")
+        totals = [totals[0] + num_frames, totals[1] + times[0], totals[2] + times[1]]
+    print(f"{'Total':<76}{totals[0]:>7}{totals[1]:>12.2f}{totals[2]:>10.2f}  ({os.cpu_count()} cores)")
+
+def benchmark_blits(frames=200):
+    """Print the per-frame blit cost of the largest and most repeated surfaces in each prepared format."""
+    background = pygame.image.load(resource_path('assets/PSHSequences/PSHStatics/PSHStatics.jpg'))
+    background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    level_frame = pygame.image.load(resource_path(PSH_PATH_TEMPLATE.format(100)))
+    level_frame = pygame.transform.scale(level_frame, scaled_frame_size('psh', *level_frame.get_size()))
+    light = pygame.image.load(resource_path('assets/Light.png'))
+    light = pygame.transform.smoothscale(light.convert_alpha(), (int(light.get_width()*0.05*(SCREEN_WIDTH/1280)), int(light.get_height()*0.05*(SCREEN_HEIGHT/720))))
+    gate = pygame.image.load(resource_path('assets/RoRStatics/Wicket_gate.png'))
+    cases = [
+        ("Level background", background, 1, prepare_surface),
+        ("PSH animation frame", level_frame, 1, prepare_surface),
+        ("Light sprite x15", light, 15, prepare_sprite),
+        ("Wicket gate sprite", gate, 1, prepare_sprite),
+    ]
+    print(f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}")
+    print(f"{'Surface':<22}{'convert_alpha':>15}{'prepared':>10}  (ms/frame)")
+    for name, surface, count, prepare in cases:
+        times = []
+        for prepared in (surface.convert_alpha(), prepare(surface)):
+            times.append(time_per_frame(lambda display: [screen.blit(prepared, (i * 20, i * 10)) for i in range(count)], frames))
+        print(f"{name:<22}{times[0]:>15.3f}{times[1]:>10.3f}")
+
+def benchmark_video_conversion(frames=60):
+    """Per-frame cost of turning a decoded menu video frame into a surface and blitting it, through the old
+    cvtColor, rot90, flipud and make_surface pipeline and through VideoBackground.FrameConverter."""
+    capture = cv2.VideoCapture(resource_path("assets/Transitions/OperatingBackground.mp4"))
+    ok, frame = capture.read()
+    capture.release()
+    if not ok:
+        print("Failed to open background video.")
+        sys.exit(1)
+    old_convert = lambda size: pygame.surfarray.make_surface(np.flipud(np.rot90(cv2.cvtColor(cv2.resize(frame, size), cv2.COLOR_BGR2RGB))))
+    print(f"Source frame {frame.shape[1]}x{frame.shape[0]}")
+    print(f"{'Resolution':<12}{'Old convert':>13}{'New convert':>13}{'Old blit':>10}{'New blit':>10}  (ms/frame)")
+    for size in SUPPORTED_RESOLUTIONS:
+        converter = VideoBackground.FrameConverter(size, screen)
+        old_surface, new_surface = old_convert(size), converter.convert(frame)
+        if not np.array_equal(pygame.surfarray.array3d(old_surface), pygame.surfarray.array3d(new_surface)):
+            print(f"{size[0]}x{size[1]}: converted frames differ")
+            sys.exit(1)
+        print(f"{f'{size[0]}x{size[1]}':<12}{time_per_frame(lambda display: old_convert(size), frames):>13.2f}"
+              f"{time_per_frame(lambda display: converter.convert(frame), frames):>13.2f}"
+              f"{time_per_frame(lambda display: screen.blit(old_surface, (0, 0)), frames):>10.2f}"
+              f"{time_per_frame(lambda display: screen.blit(new_surface, (0, 0)), frames):>10.2f}")
+
+def report_import_times(shown=15):
+    """Re-run start-up under -X importtime and log the slowest top-level imports next to the save file."""
+    if 'importtime' in sys._xoptions:
+        return  # The timed child run only needs to get through start-up
+    result = subprocess.run([sys.executable, '-X', 'importtime', os.path.abspath(__file__), '--report-import-times'],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"Timed start-up failed:\n{result.stderr}")
+        sys.exit(1)
+    imports, imported = [], set()
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        # Nested imports are indented under the module that pulled them in
+        module = fields[2][1:]
+        imported.add(module.strip())
+        if not module.startswith(' '):
+            imports.append((int(fields[1]) / 1000, int(fields[0]) / 1000, module))
+    imports.sort(reverse=True)
+    lines = [f"Import times for HydropowerMarketGame.py, {time.strftime('%Y-%m-%d %H:%M:%S')}",
+             f"Total: {sum(cumulative for cumulative, _, _ in imports):.0f} ms over {len(imports)} top-level imports",
+             f"Deferred until first use: {', '.join(name for name in ('matplotlib', 'scipy', 'cv2') if name not in imported)}",
+             "",
+             f"{'Cumulative':>12}{'Self':>10}  Module (ms)"]
+    lines += [f"{cumulative:>12.1f}{own:>10.1f}  {module}" for cumulative, own, module in imports[:shown]]
+    log_path = SAVE_FILE.parent / "import_times.log"
+    with open(log_path, 'w') as file:
+        file.write("\n".join(lines) + "\n\nFull -X importtime output:\n" + result.stderr)
+    print("\n".join(lines))
+    print(f"Written to {log_path}")
+
+def build_asset_manifest():
+    subprocess.run([sys.executable, os.path.abspath(AssetManifest.__file__), os.path.dirname(os.path.abspath(__file__))], check=True)
+
+def benchmark_asset_verification():
+    """Time the start-up check of the assets against the manifest, with the saved hash state and without it."""
+    global asset_verifier
+    for label, reset_state in (("Saved hash state", False), ("No hash state", True), ("Saved hash state", False)):
+        with asset_verifier_lock:
+            asset_verifier = None
+            if reset_state:
+                get_asset_verifier().state = {}
+        start = time.perf_counter()
+        changed, missing = verify_assets()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<18}{len(asset_verifier.manifest['files']) if asset_verifier.manifest else 0:>6} files{asset_verifier.hashed:>6} hashed"
+              f"{1000 * elapsed:>9.1f} ms  ({len(changed)} changed, {len(missing)} missing)")
+
+def check_video_clock(clip_fps=24, clip_frames=48, seconds=4):
+    """Play a synthetic clip, whose frames are filled with a gray level of 5 * index, on a simulated clock at several
+    menu frame rates, streamed and from the ring, and check every shown frame is the one due on the media clock."""
+    failed = False
+    with tempfile.TemporaryDirectory() as clip_dir:
+        clip_path = os.path.join(clip_dir, "clock_check.avi")
+        writer = cv2.VideoWriter(clip_path, cv2.VideoWriter_fourcc(*'MJPG'), clip_fps, (64, 48))
+        for index in range(clip_frames):
+            writer.write(np.full((48, 64, 3), 5 * index, dtype=np.uint8))
+        writer.release()
+        for mode, ring_budget in (("Streamed", 0), ("Ring", 2**30)):
+            for ui_fps in (60, 30, 24, 10):
+                now = [0.0]
+                video = VideoBackground.VideoBackground(clip_path, (64, 48), ring_budget=ring_budget, clock=lambda: now[0])
+                matched, worst_lag, steps = 0, 0, seconds * ui_fps
+                for step in range(steps):
+                    now[0] = step / ui_fps
+                    # Give the worker real time to decode up to the simulated clock
+                    time.sleep(0.003)
+                    # Green carries the luma, which the ring's I420 frames keep at full resolution
+                    shown = round(video.next_frame().get_at((32, 24))[1] / 5)
+                    due = int(now[0] * clip_fps + 1e-9) % clip_frames
+                    matched += shown == due
+                    worst_lag = max(worst_lag, (due - shown) % clip_frames)
+                video.close()
+                print(f"{mode:<10}{ui_fps:>4} fps menu: {matched}/{steps} frames on time, worst lag {worst_lag} frames")
+                failed = failed or matched < steps
+    if failed:
+        print("Video clock check failed.")
+        sys.exit(1)
+    print("Video clock check passed.")
+
+DEV_COMMANDS = {
+    '--benchmark-graphs': benchmark_power_graphs,
+    '--build-surface-atlas': build_surface_atlas,
+    '--warm-frame-cache': warm_frame_cache,
+    '--benchmark-frame-loading': benchmark_frame_loading,
+    '--benchmark-blits': benchmark_blits,
+    '--benchmark-video-conversion': benchmark_video_conversion,
+    '--report-import-times': report_import_times,
+    '--build-asset-manifest': build_asset_manifest,
+    '--verify-assets': benchmark_asset_verification,
+    '--check-video-clock': check_video_clock,
+}
+
 # --- MAIN PROGRAM ---
+if len(sys.argv) > 1 and sys.argv[1] in DEV_COMMANDS:
+    finish_boot()
+    DEV_COMMANDS[sys.argv[1]]()
+    sys.exit(0)
+
 has_save_file = load_game_data()
-opening_screen(background2, argonne_logo, nrel_logo, doe_logo)
+opening_screen(argonne_logo, nrel_logo, doe_logo)
 del argonne_logo
 del nrel_logo
 del doe_logo
@@ -4,6 +4,9 @@ from PyInstaller.utils.hooks import collect_all
 datas = [('assets', 'assets')]
 binaries = []
 hiddenimports = ['matplotlib.backends.backend_agg']
+# Imported by name through LazyImports, so the analysis cannot see them
+hiddenimports += ['matplotlib.pyplot', 'matplotlib.ticker', 'matplotlib.font_manager', 'matplotlib.figure',
+                  'scipy.optimize', 'cv2', 'SurfaceAtlas']
 # tmp_ret = collect_all('ortools')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
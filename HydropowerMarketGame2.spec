@@ -5,6 +5,9 @@ binaries = []
 
 # Removed ortools - only keep matplotlib backend
 hiddenimports = ['matplotlib.backends.backend_agg']
+# Imported by name through LazyImports, so the analysis cannot see them
+hiddenimports += ['matplotlib.pyplot', 'matplotlib.ticker', 'matplotlib.font_manager', 'matplotlib.figure',
+                  'scipy.optimize', 'cv2', 'SurfaceAtlas']
 
 a = Analysis(
     ['HydropowerMarketGame.py'],
@@ -0,0 +1,63 @@
+"""
+Stand-ins for the heavy libraries the game only needs on some screens: matplotlib for the
+graphs and model plots, scipy for the Environment level optimum and cv2 for the videos and
+level frame decoding.
+
+Each facade imports its library the first time one of its attributes is used, so starting
+the game only pays for pygame and numpy.
+"""
+import importlib
+import threading
+
+class LazyModule:
+    """Module proxy that imports `name` on first attribute access, after the facades it requires."""
+    def __init__(self, name, setup=None, requires=()):
+        self.name = name
+        self.setup = setup
+        self.requires = requires
+        self.module = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        if self.module is None:
+            # Frame decoding threads can reach the same facade at once
+            with self.lock:
+                if self.module is None:
+                    for facade in self.requires:
+                        facade.load()
+                    module = importlib.import_module(self.name)
+                    if self.setup is not None:
+                        self.setup(module)
+                    self.module = module
+        return self.module
+
+    def loaded(self):
+        return self.module is not None
+
+    def __getattr__(self, attribute):
+        return getattr(self.load(), attribute)
+
+def lazy_callable(facade, attribute):
+    """Function that forwards to facade.attribute, importing the facade on the first call."""
+    def call(*args, **kwargs):
+        return getattr(facade.load(), attribute)(*args, **kwargs)
+    call.__name__ = attribute
+    return call
+
+def setup_matplotlib(module):
+    module.use('Agg')
+    module.rcParams["axes3d.mouserotationstyle"] = 'azel'
+
+# Graphs and model plots
+matplotlib = LazyModule('matplotlib', setup_matplotlib)
+plt = LazyModule('matplotlib.pyplot', requires=(matplotlib,))
+mticker = LazyModule('matplotlib.ticker', requires=(matplotlib,))
+font_manager = LazyModule('matplotlib.font_manager', requires=(matplotlib,))
+Figure = lazy_callable(LazyModule('matplotlib.figure', requires=(matplotlib,)), 'Figure')
+FigureCanvasAgg = lazy_callable(LazyModule('matplotlib.backends.backend_agg', requires=(matplotlib,)), 'FigureCanvasAgg')
+
+# Environment level optimum
+linprog = lazy_callable(LazyModule('scipy.optimize'), 'linprog')
+
+# Background videos and level frame decoding
+cv2 = LazyModule('cv2')
@@ -0,0 +1,136 @@
+"""
+Pre-renders the Hydropower_Model 3D power surface (P = 0.00007 * Q * h) over a grid of
+view angles so the game can show the nearest view while the player drags the plot.
+
+Usage: python SurfaceAtlas.py OUTPUT_DIR [SCREEN_WIDTH ...]
+Each screen width gets its own folder of PNG views plus an index.json that holds the
+projection needed to draw the red operating point on top of any view.
+"""
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.ticker as mticker
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+ATLAS_VERSION = 1
+AZIM_STEP = 10
+ELEV_STEP = 10
+FIGURE_SIZES = {960: (4, 3), 1280: (5, 4), 1600: (6, 5)}
+FIGURE_DPI = 100
+MARKER_SIZE = 50
+
+surface_figures = {}
+
+def create_surface_figure(screen_width):
+    """Build the 3D surface figure shown in Hydropower_Model, sized for the screen width."""
+    fig = Figure(figsize=FIGURE_SIZES[screen_width], dpi=FIGURE_DPI)
+    ax = fig.add_subplot(111, projection='3d', computed_zorder=False)
+    fig.subplots_adjust(left=0.15, right=0.85, bottom=0.2)
+    Q = np.linspace(0, 10000, 20)
+    h = np.linspace(0, 100, 20)
+    Q_grid, h_grid = np.meshgrid(Q, h)
+    P_grid = 0.00007 * Q_grid * h_grid
+    ax.plot_surface(Q_grid, h_grid, P_grid, cmap='viridis', alpha=0.9)
+    ax.set_xlabel("Flow Rate Q (cfs)", labelpad=10)
+    ax.xaxis.set_major_formatter(mticker.StrMethodFormatter('{x:,.0f}'))
+    ax.set_ylabel("Head h (ft)", labelpad=10)
+    ax.set_zlabel("Power P (MW)", labelpad=10)
+    ax.set_xlim(0, 10000)
+    ax.set_ylim(0, 100)
+    ax.set_zlim(0, 72)
+    return fig, ax
+
+def marker_radius():
+    """Pixel radius of the scatter marker: sqrt(s) is its diameter in points, plus its 1 pt edge."""
+    return (np.sqrt(MARKER_SIZE) + 1) / 2 * FIGURE_DPI / 72
+
+def view_name(azim, elev):
+    return f"view_{azim:03d}_{elev:+03d}.png"
+
+def atlas_views():
+    """Every (azim, elev) pair in the atlas; elevation stops at the same +/-90 limit as the game."""
+    return [(azim, elev) for azim in range(0, 360, AZIM_STEP) for elev in range(-90, 91, ELEV_STEP)]
+
+def render_view(screen_width, azim, elev, output_dir):
+    """Render one view to PNG and return its index entry. Runs inside a pool worker."""
+    if screen_width not in surface_figures:
+        fig, ax = create_surface_figure(screen_width)
+        surface_figures[screen_width] = (fig, ax, FigureCanvasAgg(fig))
+    fig, ax, canvas = surface_figures[screen_width]
+    ax.view_init(elev=elev, azim=azim)
+    file_name = view_name(azim, elev)
+    fig.savefig(os.path.join(output_dir, file_name), dpi=FIGURE_DPI)
+    return {
+        'azim': azim,
+        'elev': elev,
+        'file': file_name,
+        'projection': ax.M.tolist(),
+        'transform': ax.transData.get_matrix().tolist()
+    }
+
+def build_atlas(screen_width, output_dir, workers=None):
+    """Render every view for one screen width; index.json is written last, so a partial build is never used."""
+    os.makedirs(output_dir, exist_ok=True)
+    views = atlas_views()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        entries = list(executor.map(render_view, [screen_width] * len(views), [azim for azim, _ in views],
+                                    [elev for _, elev in views], [output_dir] * len(views)))
+    width, height = FIGURE_SIZES[screen_width]
+    index = {
+        'version': ATLAS_VERSION,
+        'screen_width': screen_width,
+        'size': [int(width * FIGURE_DPI), int(height * FIGURE_DPI)],
+        'azim_step': AZIM_STEP,
+        'elev_step': ELEV_STEP,
+        'marker_radius': marker_radius(),
+        'views': {entry['file']: entry for entry in entries}
+    }
+    with open(os.path.join(output_dir, "index.json.tmp"), 'w') as file:
+        json.dump(index, file)
+    os.replace(os.path.join(output_dir, "index.json.tmp"), os.path.join(output_dir, "index.json"))
+    return index
+
+def load_atlas_index(atlas_dir):
+    """Return the atlas index for a folder, or None if it is missing, unfinished or out of date."""
+    index_path = os.path.join(atlas_dir, "index.json")
+    if not os.path.exists(index_path):
+        return None
+    try:
+        with open(index_path, 'r') as file:
+            index = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if index.get('version') != ATLAS_VERSION:
+        return None
+    return index
+
+def nearest_view(index, azim, elev):
+    """Index entry of the pre-rendered view closest to the requested angles."""
+    azim_step, elev_step = index['azim_step'], index['elev_step']
+    nearest_azim = int(round(azim / azim_step) * azim_step) % 360
+    nearest_elev = int(max(-90, min(90, round(elev / elev_step) * elev_step)))
+    return index['views'][view_name(nearest_azim, nearest_elev)]
+
+def project_point(view, height, x, y, z):
+    """Pixel position (top-left origin) of a data point in a pre-rendered view."""
+    projected = np.array(view['projection']) @ np.array([x, y, z, 1.0])
+    axes_x, axes_y = projected[0] / projected[3], projected[1] / projected[3]
+    pixel_x, pixel_y, _ = np.array(view['transform']) @ np.array([axes_x, axes_y, 1.0])
+    return pixel_x, height - pixel_y
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python SurfaceAtlas.py OUTPUT_DIR [SCREEN_WIDTH ...]")
+        sys.exit(1)
+    output_root = sys.argv[1]
+    screen_widths = [int(width) for width in sys.argv[2:]] or sorted(FIGURE_SIZES)
+    for screen_width in screen_widths:
+        print(f"Building {len(atlas_views())} views for {screen_width} px wide screens...")
+        build_atlas(screen_width, os.path.join(output_root, str(screen_width)))
+    print("Surface atlas complete.")
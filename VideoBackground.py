@@ -0,0 +1,233 @@
+"""
+Looping background video for the menu screens.
+
+A worker thread reads, resizes and color-converts the frames into a small bounded queue, so
+the screen's own loop only takes a ready surface each frame and never waits on the decoder.
+A clip whose frames fit in the ring budget is decoded only once: the first pass keeps every
+frame and later passes loop over them with the worker stopped. Ring frames are kept as I420
+(1.5 bytes a pixel, the chroma subsampling the clips are encoded with anyway) and expanded into
+one reused display surface when they are shown, so a 192-frame clip at 1280x720 takes about
+250 MB instead of the 700 MB it would as 32-bit surfaces.
+
+Playback follows a media clock at the clip's own frame rate rather than the screen's loop
+rate: frames that are late are dropped and an early one waits, so the clip plays at the same
+speed whether the menu runs at 60 fps or far fewer.
+"""
+import atexit
+import queue
+import sys
+import threading
+import time
+import weakref
+
+import numpy as np
+import pygame
+from LazyImports import cv2
+
+# Screens can exit the game without closing their video; stop the workers before the interpreter
+# tears down, since a daemon thread killed inside the decoder aborts the process
+open_videos = weakref.WeakSet()
+# Frame rate assumed for clips that do not report one
+DEFAULT_FPS = 30
+
+def surface_color_conversion(surface):
+    """cv2 code that turns BGR pixels into the byte order of a 32-bit surface, or None for any other layout."""
+    if surface is None or surface.get_bytesize() != 4:
+        return None
+    red, green, blue, _ = surface.get_masks()
+    def byte_index(mask):
+        index = (mask.bit_length() - 1) // 8
+        return index if sys.byteorder == 'little' else 3 - index
+    layout = (byte_index(blue), byte_index(green), byte_index(red))
+    return {(0, 1, 2): cv2.COLOR_BGR2BGRA, (2, 1, 0): cv2.COLOR_BGR2RGBA}.get(layout)
+
+def ring_color_conversion(conversion):
+    """cv2 code that expands an I420 ring frame into the same surface layout as a BGR conversion code."""
+    return {cv2.COLOR_BGR2BGRA: cv2.COLOR_YUV2BGRA_I420, cv2.COLOR_BGR2RGBA: cv2.COLOR_YUV2RGBA_I420}[conversion]
+
+def write_frame(frame, surface, conversion):
+    """Color-convert a BGR frame of the surface's size straight into the surface's pixels."""
+    width, height = surface.get_size()
+    pixels = np.frombuffer(surface.get_buffer(), np.uint8).reshape(height, surface.get_pitch())[:, :width * 4]
+    cv2.cvtColor(frame, conversion, dst=pixels.reshape(height, width, 4))
+
+class FrameConverter:
+    """Turns BGR video frames into surfaces laid out like the template surface, normally the display.
+    The frame is resized into a reused buffer and color-converted directly into the new surface's pixels,
+    so no other full-frame copy is made and the surface blits without conversion."""
+    def __init__(self, size, template):
+        self.size = tuple(size)
+        self.template = template
+        self.conversion = surface_color_conversion(template)
+        self.resized = None
+
+    def display_format(self):
+        return self.conversion is not None
+
+    def can_compact(self):
+        """I420 needs even dimensions and is only expanded straight into 32-bit display surfaces."""
+        return self.display_format() and self.size[0] % 2 == 0 and self.size[1] % 2 == 0
+
+    def resize(self, frame):
+        if (frame.shape[1], frame.shape[0]) != self.size:
+            self.resized = cv2.resize(frame, self.size, dst=self.resized)
+            frame = self.resized
+        return frame
+
+    def convert(self, frame):
+        if self.conversion is None:
+            # The display is not 32-bit; let pygame pick the format
+            frame = cv2.resize(frame, self.size)
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            return pygame.surfarray.make_surface(np.flipud(np.rot90(frame)))
+        surface = pygame.Surface(self.size, 0, self.template)
+        write_frame(self.resize(frame), surface, self.conversion)
+        return surface
+
+    def compact(self, frame):
+        """The frame resized and stored as I420 planes for the ring."""
+        return cv2.cvtColor(self.resize(frame), cv2.COLOR_BGR2YUV_I420)
+
+    def expand(self, planes, surface):
+        """Write a compact ring frame into a display-format surface of the target size."""
+        write_frame(planes, surface, ring_color_conversion(self.conversion))
+        return surface
+
+class VideoBackground:
+    """Background video decoded on a worker thread; next_frame() returns the surface due on the media clock."""
+    def __init__(self, path, size, queue_size=4, ring_budget=0, clock=time.perf_counter):
+        self.converter = FrameConverter(size, pygame.display.get_surface())
+        self.size = size
+        self.capture = cv2.VideoCapture(path)
+        fps = self.capture.get(cv2.CAP_PROP_FPS)
+        self.fps = fps if fps > 0 else DEFAULT_FPS
+        self.clock = clock
+        # Media clock time of frame 0, set when the first frame is shown
+        self.start_time = None
+        # Frames are queued as (index, surface); indices keep counting across passes of the clip
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.pending = None
+        self.surface = None
+        # Compact frames kept from the first pass, or None to stream the clip on every pass
+        self.ring = None
+        self.ring_complete = False
+        self.ring_surface = None
+        self.ring_index = None
+        if self.converter.can_compact() and 0 < self.ring_bytes() <= ring_budget:
+            self.ring = []
+            self.ring_surface = pygame.Surface(size, 0, self.converter.template)
+        self.stopped = threading.Event()
+        self.finished = threading.Event()
+        self.worker = None
+        if self.capture.isOpened():
+            self.worker = threading.Thread(target=self.decode_loop, daemon=True)
+            self.worker.start()
+            open_videos.add(self)
+
+    def is_opened(self):
+        return self.worker is not None
+
+    def ring_bytes(self):
+        """Memory the whole clip takes as I420 frames at the target size; 0 if the frame count is unknown."""
+        return max(0, int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT))) * self.size[0] * self.size[1] * 3 // 2
+
+    def media_index(self):
+        """Index of the frame due now, counting from the first frame shown."""
+        if self.start_time is None:
+            return 0
+        return int((self.clock() - self.start_time) * self.fps)
+
+    def grab_frame(self):
+        """Advance to the next frame of the clip, starting over at the end unless the frames go to the ring.
+        False at the end of the ring pass or if the clip cannot be read."""
+        if self.capture.grab():
+            return True
+        if self.ring is None:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            return self.capture.grab()
+        return False
+
+    def decode_loop(self):
+        index = 0
+        try:
+            while not self.stopped.is_set():
+                if not self.grab_frame():
+                    break
+                # A streamed frame that is already late is skipped before the resize and color conversion;
+                # the ring needs every frame
+                if self.ring is None and index < self.media_index():
+                    index += 1
+                    continue
+                ok, frame = self.capture.retrieve()
+                if not ok:
+                    break
+                item = (index, self.converter.compact(frame) if self.ring is not None else self.converter.convert(frame))
+                index += 1
+                while not self.stopped.is_set():
+                    try:
+                        self.frames.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+        finally:
+            self.capture.release()
+            self.finished.set()
+
+    def take_frame(self):
+        """Move the next decoded frame to self.pending; False if none is ready."""
+        try:
+            index, frame = self.frames.get_nowait()
+        except queue.Empty:
+            return False
+        if self.ring is not None:
+            self.ring.append(frame)
+        self.pending = (index, frame)
+        return True
+
+    def show(self, index, frame):
+        """Surface for a frame that is now due; ring frames are expanded into the one ring surface."""
+        if self.ring is None:
+            return frame
+        if index != self.ring_index:
+            self.converter.expand(frame, self.ring_surface)
+            self.ring_index = index
+        return self.ring_surface
+
+    def next_frame(self):
+        """The latest frame due on the media clock; late frames are dropped and the current one is held
+        until the next is due. Only the first call waits for the decoder; returns None if the clip cannot be read.
+        In ring mode the same surface is returned each time with the due frame written into it."""
+        if self.ring_complete:
+            index = self.media_index() % len(self.ring)
+            self.surface = self.show(index, self.ring[index])
+            return self.surface
+        while True:
+            if self.pending is None and not self.take_frame():
+                if self.finished.is_set() and self.ring:
+                    # First pass done and the worker has stopped; loop the kept frames from here on
+                    self.ring_complete = True
+                    return self.next_frame()
+                if self.surface is not None or self.finished.is_set():
+                    return self.surface
+                self.finished.wait(0.005)
+                continue
+            index, frame = self.pending
+            if self.start_time is None:
+                self.start_time = self.clock() - index / self.fps
+            if index > self.media_index():
+                return self.surface
+            self.surface = self.show(index, frame)
+            self.pending = None
+
+    def close(self):
+        self.stopped.set()
+        if self.worker is not None:
+            self.worker.join()
+        self.ring = None
+        self.ring_surface = None
+        open_videos.discard(self)
+
+@atexit.register
+def close_open_videos():
+    for video in list(open_videos):
+        video.close()